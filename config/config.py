@@ -1,24 +1,72 @@
 from configparser import ConfigParser
 
-
-def get_config_section_values(section: str) -> tuple:
-    options = config.options(section)
-    return tuple(config.get(section, option) for option in options)
-
-
 config = ConfigParser()
 config.read("config/config.ini")
 DJANGO_SECTION = "django"
 CANVAS_SECTION = "canvas"
+DATA_WAREHOUSE_SECTION = "data_warehouse"
+SYNC_SECTION = "sync"
 SECRET_KEY_VALUE = config.get(DJANGO_SECTION, "secret_key", raw=True)
 DEBUG_VALUE = config.getboolean(DJANGO_SECTION, "debug", fallback=False)
 PROD_URL = config.get(CANVAS_SECTION, "prod_url")
 PROD_KEY = config.get(CANVAS_SECTION, "prod_key")
 TEST_URL = config.get(CANVAS_SECTION, "test_url")
 TEST_KEY = config.get(CANVAS_SECTION, "test_key")
-(
-    DATA_WAREHOUSE_USERNAME,
-    DATA_WAREHOUSE_PASSWORD,
-    DATA_WAREHOUSE_SERVICE,
-) = get_config_section_values("data_warehouse")
+DATA_WAREHOUSE_USERNAME = config.get(DATA_WAREHOUSE_SECTION, "user")
+DATA_WAREHOUSE_PASSWORD = config.get(DATA_WAREHOUSE_SECTION, "password")
+DATA_WAREHOUSE_SERVICE = config.get(DATA_WAREHOUSE_SECTION, "service")
+DATA_WAREHOUSE_BACKEND = config.get(
+    DATA_WAREHOUSE_SECTION, "backend", fallback="oracle"
+)
+DATA_WAREHOUSE_SQLITE_PATH = config.get(
+    DATA_WAREHOUSE_SECTION, "sqlite_path", fallback="data_warehouse.sqlite3"
+)
+DATA_WAREHOUSE_POOL_MIN = config.getint(DATA_WAREHOUSE_SECTION, "pool_min", fallback=1)
+DATA_WAREHOUSE_POOL_MAX = config.getint(DATA_WAREHOUSE_SECTION, "pool_max", fallback=4)
+DATA_WAREHOUSE_POOL_INCREMENT = config.getint(
+    DATA_WAREHOUSE_SECTION, "pool_increment", fallback=1
+)
+DATA_WAREHOUSE_POOL_TIMEOUT = config.getint(
+    DATA_WAREHOUSE_SECTION, "pool_timeout", fallback=10
+)
+DATA_WAREHOUSE_ARRAYSIZE = config.getint(
+    DATA_WAREHOUSE_SECTION, "arraysize", fallback=1000
+)
+DATA_WAREHOUSE_CACHE_TTL = config.getint(
+    DATA_WAREHOUSE_SECTION, "cache_ttl", fallback=300
+)
+DATA_WAREHOUSE_CACHE_NEGATIVE_TTL = config.getint(
+    DATA_WAREHOUSE_SECTION, "cache_negative_ttl", fallback=60
+)
+DATA_WAREHOUSE_CACHE_MAX_ENTRIES = config.getint(
+    DATA_WAREHOUSE_SECTION, "cache_max_entries", fallback=1024
+)
+DATA_WAREHOUSE_SLOW_QUERY_THRESHOLD = config.getfloat(
+    DATA_WAREHOUSE_SECTION, "slow_query_threshold", fallback=1.0
+)
+DATA_WAREHOUSE_STATS_FLUSH_INTERVAL = config.getint(
+    DATA_WAREHOUSE_SECTION, "stats_flush_interval", fallback=60
+)
+DATA_WAREHOUSE_CALL_TIMEOUT = config.getint(
+    DATA_WAREHOUSE_SECTION, "call_timeout", fallback=30
+)
+DATA_WAREHOUSE_SYNC_CALL_TIMEOUT = config.getint(
+    DATA_WAREHOUSE_SECTION, "sync_call_timeout", fallback=0
+)
+DATA_WAREHOUSE_FAILURE_THRESHOLD = config.getint(
+    DATA_WAREHOUSE_SECTION, "failure_threshold", fallback=5
+)
+DATA_WAREHOUSE_FAILURE_COOLDOWN = config.getint(
+    DATA_WAREHOUSE_SECTION, "failure_cooldown", fallback=60
+)
+DATA_WAREHOUSE_STATEMENT_CACHE_SIZE = config.getint(
+    DATA_WAREHOUSE_SECTION, "statement_cache_size", fallback=50
+)
+DATA_WAREHOUSE_RETRIES = config.getint(DATA_WAREHOUSE_SECTION, "retries", fallback=3)
+DATA_WAREHOUSE_RETRY_BACKOFF = config.getfloat(
+    DATA_WAREHOUSE_SECTION, "retry_backoff", fallback=0.5
+)
+SYNC_MAX_DELETE_FRACTION = config.getfloat(
+    SYNC_SECTION, "max_delete_fraction", fallback=0.1
+)
 LIB_DIR = config.get("cx_oracle", "lib_dir")
@@ -1,6 +1,15 @@
 from django.contrib.admin import site
 
-from form.models import Request, ScheduleType, School, Section, Subject, User
+from form.models import (
+    QueryStatistic,
+    Request,
+    ScheduleType,
+    School,
+    Section,
+    Subject,
+    SyncRun,
+    User,
+)
 
 site.register(User)
 site.register(ScheduleType)
@@ -8,3 +17,5 @@ site.register(School)
 site.register(Subject)
 site.register(Section)
 site.register(Request)
+site.register(QueryStatistic)
+site.register(SyncRun)
@@ -1,30 +1,581 @@
+from atexit import register
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha1
+from itertools import chain
 from logging import getLogger
-from typing import Optional
+from os import getpid
+from random import uniform
+from re import sub
+from sqlite3 import OperationalError
+from sqlite3 import connect as connect_sqlite
+from threading import Lock
+from time import monotonic, perf_counter, sleep
+from typing import Callable, Iterable, Iterator, Optional, Union
+from zlib import crc32
 
-from cx_Oracle import connect
+from cx_Oracle import (
+    SPOOL_ATTRVAL_TIMEDWAIT,
+    Connection,
+    Cursor,
+    DatabaseError,
+    SessionPool,
+)
+from django.db import connection as db_connection
+from django.db import transaction
 
 from config.config import (
+    DATA_WAREHOUSE_ARRAYSIZE,
+    DATA_WAREHOUSE_BACKEND,
+    DATA_WAREHOUSE_CACHE_MAX_ENTRIES,
+    DATA_WAREHOUSE_CACHE_NEGATIVE_TTL,
+    DATA_WAREHOUSE_CACHE_TTL,
+    DATA_WAREHOUSE_CALL_TIMEOUT,
+    DATA_WAREHOUSE_FAILURE_COOLDOWN,
+    DATA_WAREHOUSE_FAILURE_THRESHOLD,
     DATA_WAREHOUSE_PASSWORD,
+    DATA_WAREHOUSE_POOL_INCREMENT,
+    DATA_WAREHOUSE_POOL_MAX,
+    DATA_WAREHOUSE_POOL_MIN,
+    DATA_WAREHOUSE_POOL_TIMEOUT,
+    DATA_WAREHOUSE_RETRIES,
+    DATA_WAREHOUSE_RETRY_BACKOFF,
     DATA_WAREHOUSE_SERVICE,
+    DATA_WAREHOUSE_SLOW_QUERY_THRESHOLD,
+    DATA_WAREHOUSE_SQLITE_PATH,
+    DATA_WAREHOUSE_STATEMENT_CACHE_SIZE,
+    DATA_WAREHOUSE_STATS_FLUSH_INTERVAL,
     DATA_WAREHOUSE_USERNAME,
 )
 
 logger = getLogger(__name__)
+ORACLE_BACKEND = "oracle"
+SQLITE_BACKEND = "sqlite"
+IN_LIST_LIMIT = 1000
+RETRYABLE_ORACLE_ERROR_CODES = {
+    1033,
+    1034,
+    1089,
+    3113,
+    3114,
+    3135,
+    12170,
+    12516,
+    12519,
+    12520,
+    12528,
+    12537,
+    12541,
+    12543,
+    12547,
+    12571,
+    24459,
+    25408,
+}
+RETRYABLE_ORACLE_DPI_ERRORS = ("DPI-1010", "DPI-1067", "DPI-1080")
+RETRYABLE_SQLITE_ERRORS = ("database is locked", "database is busy")
+
+
+class DataWarehouseError(Exception):
+    pass
+
 
+class DataWarehouseUnavailableError(DataWarehouseError):
+    pass
 
-def get_cursor():
-    connection = connect(
-        DATA_WAREHOUSE_USERNAME, DATA_WAREHOUSE_PASSWORD, DATA_WAREHOUSE_SERVICE
+
+@lru_cache
+def get_pool(pid: int) -> SessionPool:
+    logger.info(f"Creating Data Warehouse session pool for process {pid}...")
+    return SessionPool(
+        user=DATA_WAREHOUSE_USERNAME,
+        password=DATA_WAREHOUSE_PASSWORD,
+        dsn=DATA_WAREHOUSE_SERVICE,
+        min=DATA_WAREHOUSE_POOL_MIN,
+        max=DATA_WAREHOUSE_POOL_MAX,
+        increment=DATA_WAREHOUSE_POOL_INCREMENT,
+        getmode=SPOOL_ATTRVAL_TIMEDWAIT,
+        wait_timeout=DATA_WAREHOUSE_POOL_TIMEOUT * 1000,
+        stmtcachesize=DATA_WAREHOUSE_STATEMENT_CACHE_SIZE,
+        threaded=True,
     )
-    return connection.cursor()
 
 
-def execute_query(query: str, kwargs: Optional[dict] = None):
-    kwargs = kwargs or {}
-    try:
-        cursor = get_cursor()
+class OracleBackend:
+    name = ORACLE_BACKEND
+
+    @staticmethod
+    def get_connection() -> Connection:
+        connection = get_pool(getpid()).acquire()
+        connection.callTimeout = call_timeout * 1000
+        return connection
+
+    @staticmethod
+    def release_connection(connection: Connection):
+        get_pool(getpid()).release(connection)
+
+    @staticmethod
+    def drop_connection(connection: Connection):
+        get_pool(getpid()).drop(connection)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if not isinstance(error, DatabaseError) or not error.args:
+            return False
+        error_object = error.args[0]
+        if getattr(error_object, "isrecoverable", False):
+            return True
+        if getattr(error_object, "code", None) in RETRYABLE_ORACLE_ERROR_CODES:
+            return True
+        message = getattr(error_object, "message", str(error_object))
+        return message.startswith(RETRYABLE_ORACLE_DPI_ERRORS)
+
+    @staticmethod
+    def set_arraysize(cursor: Cursor, arraysize: int, prefetch_rows: int):
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = prefetch_rows
+
+    @staticmethod
+    def set_row_factory(cursor: Cursor, row_factory: Callable):
+        cursor.rowfactory = row_factory
+
+    @staticmethod
+    def execute(cursor: Cursor, query: str, kwargs: dict):
         cursor.execute(query, **kwargs)
+
+
+class SqliteBackend:
+    name = SQLITE_BACKEND
+    SCHEMAS = ["dwngss", "dwngss_ps"]
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def get_connection(self):
+        connection = connect_sqlite(
+            self.path, cached_statements=DATA_WAREHOUSE_STATEMENT_CACHE_SIZE
+        )
+        for schema in self.SCHEMAS:
+            connection.execute(f"ATTACH DATABASE ? AS {schema}", (self.path,))
+        connection.create_function("ORA_HASH", 1, self.ora_hash, deterministic=True)
+        return connection
+
+    @staticmethod
+    def ora_hash(value) -> Optional[int]:
+        return None if value is None else crc32(str(value).encode())
+
+    @staticmethod
+    def release_connection(connection):
+        connection.close()
+
+    @staticmethod
+    def drop_connection(connection):
+        connection.close()
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        return isinstance(error, OperationalError) and str(error).startswith(
+            RETRYABLE_SQLITE_ERRORS
+        )
+
+    @staticmethod
+    def set_arraysize(cursor, arraysize: int, prefetch_rows: int):
+        cursor.arraysize = arraysize
+
+    @staticmethod
+    def set_row_factory(cursor, row_factory: Callable):
+        cursor.row_factory = lambda _, row: row_factory(*row)
+
+    @staticmethod
+    def execute(cursor, query: str, kwargs: dict):
+        bindings = {key.lstrip(":"): value for key, value in kwargs.items()}
+        cursor.execute(query, bindings)
+
+
+def get_configured_backend() -> Union[OracleBackend, SqliteBackend]:
+    if DATA_WAREHOUSE_BACKEND == SQLITE_BACKEND:
+        return SqliteBackend(DATA_WAREHOUSE_SQLITE_PATH)
+    return OracleBackend()
+
+
+backend = get_configured_backend()
+call_timeout = DATA_WAREHOUSE_CALL_TIMEOUT
+
+
+def set_backend(new_backend: Union[OracleBackend, SqliteBackend]):
+    global backend
+    logger.info(f"Using '{new_backend.name}' Data Warehouse backend")
+    backend = new_backend
+    query_cache.clear()
+
+
+def set_call_timeout(timeout: int):
+    global call_timeout
+    timeout_value = f"{timeout}s" if timeout else "no"
+    logger.info(f"Using {timeout_value} Data Warehouse call timeout")
+    call_timeout = timeout
+
+
+class QueryCache:
+    def __init__(self, ttl: int, negative_ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple, tuple[float, tuple]] = OrderedDict()
+        self.lock = Lock()
+
+    @staticmethod
+    def get_key(query: str, kwargs: Optional[dict] = None) -> tuple:
+        bindings = tuple(sorted((kwargs or {}).items()))
+        return " ".join(query.split()), bindings
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            expires_at, rows = entry
+            if expires_at <= monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return rows
+
+    def set(self, key: tuple, rows: tuple):
+        ttl = self.ttl if rows else self.negative_ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (monotonic() + ttl, rows)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+query_cache = QueryCache(
+    DATA_WAREHOUSE_CACHE_TTL,
+    DATA_WAREHOUSE_CACHE_NEGATIVE_TTL,
+    DATA_WAREHOUSE_CACHE_MAX_ENTRIES,
+)
+
+
+def normalize_query(query: str) -> str:
+    query = sub(r"'(?:[^']|'')*'", "?", query)
+    query = sub(r":\w+(?:\s*,\s*:\w+)+", ":list", query)
+    query = sub(r"(?<![:\w])\d+\b", "?", query)
+    return " ".join(query.split())
+
+
+def get_row_fingerprint(row: Iterable) -> str:
+    return sha1(repr(tuple(row)).encode()).hexdigest()[:16]
+
+
+def get_query_fingerprint(query: str) -> tuple[str, str]:
+    normalized_query = normalize_query(query)
+    fingerprint = sha1(normalized_query.encode()).hexdigest()[:16]
+    return fingerprint, normalized_query
+
+
+class QueryStatistics:
+    def __init__(self, slow_query_threshold: float, flush_interval: int):
+        self.slow_query_threshold = slow_query_threshold
+        self.flush_interval = flush_interval
+        self.pending: dict[str, dict] = dict()
+        self.last_flush = monotonic()
+        self.lock = Lock()
+
+    def record(self, query: str, elapsed: float, rows: int):
+        fingerprint, normalized_query = get_query_fingerprint(query)
+        slow = elapsed >= self.slow_query_threshold
+        if slow:
+            logger.warning(
+                f"SLOW Data Warehouse query [{fingerprint}] ({elapsed:.3f}s,"
+                f" {rows} rows): {normalized_query}"
+            )
+        with self.lock:
+            statistic = self.pending.setdefault(
+                fingerprint,
+                {
+                    "query": normalized_query,
+                    "calls": 0,
+                    "rows": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "slow_calls": 0,
+                },
+            )
+            statistic["calls"] += 1
+            statistic["rows"] += rows
+            statistic["total_time"] += elapsed
+            statistic["max_time"] = max(statistic["max_time"], elapsed)
+            statistic["slow_calls"] += int(slow)
+            flush = monotonic() - self.last_flush >= self.flush_interval
+        if flush:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = dict()
+            self.last_flush = monotonic()
+        if not pending:
+            return
+        try:
+            from .models import QueryStatistic
+
+            with transaction.atomic():
+                for fingerprint, statistic in pending.items():
+                    QueryStatistic.record(fingerprint, **statistic)
+        except Exception as error:
+            logger.warning(f"FAILED to save Data Warehouse query statistics: {error}")
+
+    def flush_at_exit(self):
+        from .models import QueryStatistic
+
+        if not self.pending:
+            return
+        try:
+            table_names = db_connection.introspection.table_names()
+        except Exception as error:
+            logger.warning(f"FAILED to save Data Warehouse query statistics: {error}")
+            return
+        if QueryStatistic._meta.db_table in table_names:
+            self.flush()
+
+
+query_statistics = QueryStatistics(
+    DATA_WAREHOUSE_SLOW_QUERY_THRESHOLD, DATA_WAREHOUSE_STATS_FLUSH_INTERVAL
+)
+register(query_statistics.flush_at_exit)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, cooldown: int):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.lock = Lock()
+
+    def is_open(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return False
+            return monotonic() - self.opened_at < self.cooldown
+
+    def record_success(self):
+        with self.lock:
+            if self.opened_at is not None:
+                logger.info("Data Warehouse circuit breaker CLOSED")
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            half_open = self.opened_at is not None
+            if half_open or self.failures >= self.failure_threshold:
+                self.opened_at = monotonic()
+                logger.warning(
+                    f"Data Warehouse circuit breaker OPEN after {self.failures}"
+                    f" failures; skipping queries for {self.cooldown}s"
+                )
+
+
+circuit_breaker = CircuitBreaker(
+    DATA_WAREHOUSE_FAILURE_THRESHOLD, DATA_WAREHOUSE_FAILURE_COOLDOWN
+)
+
+
+def is_data_warehouse_available() -> bool:
+    return not circuit_breaker.is_open()
+
+
+def get_connection():
+    return backend.get_connection()
+
+
+def release_connection(connection):
+    try:
+        backend.release_connection(connection)
+    except Exception as error:
+        logger.warning(f"FAILED to release Data Warehouse connection: '{error}'")
+
+
+def drop_connection(connection):
+    try:
+        backend.drop_connection(connection)
+    except Exception as error:
+        logger.warning(f"FAILED to drop Data Warehouse connection: '{error}'")
+
+
+def get_retry_delay(attempt: int) -> float:
+    return uniform(0, DATA_WAREHOUSE_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+
+def execute_cursor(
+    connection: Connection,
+    query: str,
+    kwargs: dict,
+    arraysize: Optional[int] = None,
+    prefetch_rows: Optional[int] = None,
+    row_factory: Optional[Callable] = None,
+) -> Cursor:
+    try:
+        cursor = connection.cursor()
+        if arraysize:
+            backend.set_arraysize(cursor, arraysize, prefetch_rows or arraysize)
+        if row_factory:
+            backend.set_row_factory(cursor, row_factory)
+        backend.execute(cursor, query, kwargs)
         return cursor
     except Exception as error:
-        logger.error(f"FAILED to connect to Data Warehouse: '{error}'")
-        return ()
+        if backend.is_retryable(error):
+            drop_connection(connection)
+        else:
+            release_connection(connection)
+        raise
+
+
+def open_cursor(
+    query: str,
+    kwargs: Optional[dict] = None,
+    arraysize: Optional[int] = None,
+    prefetch_rows: Optional[int] = None,
+    row_factory: Optional[Callable] = None,
+) -> tuple[Connection, Cursor]:
+    kwargs = kwargs or {}
+    attempt = 0
+    while True:
+        if circuit_breaker.is_open():
+            logger.warning("SKIPPING Data Warehouse query (circuit breaker open)")
+            raise DataWarehouseUnavailableError("Data Warehouse circuit breaker open")
+        connection = None
+        try:
+            connection = get_connection()
+            cursor = execute_cursor(
+                connection, query, kwargs, arraysize, prefetch_rows, row_factory
+            )
+            circuit_breaker.record_success()
+            return connection, cursor
+        except Exception as error:
+            attempt += 1
+            retryable = backend.is_retryable(error)
+            if not retryable or attempt > DATA_WAREHOUSE_RETRIES:
+                if retryable or connection is None:
+                    circuit_breaker.record_failure()
+                logger.error(f"FAILED to query Data Warehouse: '{error}'")
+                raise DataWarehouseError(error) from error
+            delay = get_retry_delay(attempt)
+            logger.warning(
+                f"RETRYING Data Warehouse query in {delay:.2f}s (attempt {attempt}"
+                f" of {DATA_WAREHOUSE_RETRIES}): '{error}'"
+            )
+            sleep(delay)
+
+
+def fetch_batches(
+    connection: Connection,
+    cursor: Cursor,
+    query: str,
+    elapsed: float,
+    batch_size: Optional[int] = None,
+) -> Iterator[list[tuple]]:
+    row_count = 0
+    retryable = False
+    try:
+        while True:
+            started_at = perf_counter()
+            rows = cursor.fetchmany(batch_size or cursor.arraysize)
+            elapsed += perf_counter() - started_at
+            if not rows:
+                break
+            row_count += len(rows)
+            yield rows
+    except Exception as error:
+        retryable = backend.is_retryable(error)
+        if retryable:
+            circuit_breaker.record_failure()
+        logger.error(f"FAILED to fetch Data Warehouse rows: '{error}'")
+        raise DataWarehouseError(error) from error
+    finally:
+        if retryable:
+            drop_connection(connection)
+        else:
+            cursor.close()
+            release_connection(connection)
+        query_statistics.record(query, elapsed, row_count)
+
+
+def execute_query(
+    query: str,
+    kwargs: Optional[dict] = None,
+    cache=False,
+    row_factory: Optional[Callable] = None,
+) -> Union[Iterator[tuple], tuple]:
+    if cache:
+        key = query_cache.get_key(query, kwargs)
+        rows = query_cache.get(key)
+        if rows is not None:
+            return rows
+    started_at = perf_counter()
+    connection, cursor = open_cursor(query, kwargs, row_factory=row_factory)
+    elapsed = perf_counter() - started_at
+    rows = chain.from_iterable(fetch_batches(connection, cursor, query, elapsed))
+    if not cache:
+        return rows
+    rows = tuple(rows)
+    query_cache.set(key, rows)
+    return rows
+
+
+def stream_query(
+    query: str,
+    kwargs: Optional[dict] = None,
+    batch_size: int = DATA_WAREHOUSE_ARRAYSIZE,
+    prefetch_rows: Optional[int] = None,
+    row_factory: Optional[Callable] = None,
+) -> Iterator[list[tuple]]:
+    started_at = perf_counter()
+    connection, cursor = open_cursor(
+        query, kwargs, batch_size, prefetch_rows, row_factory
+    )
+    elapsed = perf_counter() - started_at
+    yield from fetch_batches(connection, cursor, query, elapsed, batch_size)
+
+
+def get_in_list_size(count: int) -> int:
+    size = 1
+    while size < count:
+        size *= 2
+    return min(size, IN_LIST_LIMIT)
+
+
+def get_in_list_condition(column: str, values: list) -> tuple[str, dict]:
+    name = column.split(".")[-1]
+    size = get_in_list_size(len(values))
+    values = values + [values[-1]] * (size - len(values))
+    kwargs = {f"{name}_{index}": value for index, value in enumerate(values)}
+    placeholders = ", ".join(f":{key}" for key in kwargs)
+    return f"{column} IN ({placeholders})", kwargs
+
+
+def get_in_list_queries(
+    query: str,
+    column: str,
+    values: Iterable,
+    kwargs: Optional[dict] = None,
+    chunk_size: int = IN_LIST_LIMIT,
+    keyword: str = "AND",
+) -> Iterator[tuple[str, dict]]:
+    values = list(dict.fromkeys(values))
+    chunk_size = min(chunk_size, IN_LIST_LIMIT)
+    for start in range(0, len(values), chunk_size):
+        end = start + chunk_size
+        chunk = values[start:end]
+        condition, bindings = get_in_list_condition(column, chunk)
+        yield f"{query} {keyword} {condition}", (kwargs or {}) | bindings
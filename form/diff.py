@@ -0,0 +1,75 @@
+from typing import NamedTuple
+
+from django.db.models import QuerySet
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RowDiff(NamedTuple):
+    inserted: list[str]
+    changed: list[str]
+    unchanged: list[str]
+
+
+class RowSnapshot:
+    def __init__(self, keys: list[str], hashes: list[str], columnar=True):
+        self.size = len(keys)
+        self.columnar = columnar and numpy is not None and bool(keys)
+        if self.columnar:
+            key_array = numpy.array(keys)
+            order = numpy.argsort(key_array)
+            self.keys = key_array[order]
+            self.hashes = numpy.array(hashes)[order]
+        else:
+            self.hashes_by_key = dict(zip(keys, hashes))
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_queryset(
+        cls, queryset: QuerySet, key_field: str, hash_field: str, columnar=True
+    ):
+        rows = list(queryset.values_list(key_field, hash_field))
+        keys = [key for key, _ in rows]
+        hashes = [row_hash for _, row_hash in rows]
+        return cls(keys, hashes, columnar)
+
+    def diff(self, keys: list[str], hashes: list[str]) -> RowDiff:
+        if not keys:
+            return RowDiff(list(), list(), list())
+        if not self.columnar:
+            return self.diff_rows(keys, hashes)
+        key_array = numpy.array(keys)
+        hash_array = numpy.array(hashes)
+        positions = numpy.minimum(
+            numpy.searchsorted(self.keys, key_array), self.size - 1
+        )
+        found = self.keys[positions] == key_array
+        unchanged = found & (self.hashes[positions] == hash_array)
+        return RowDiff(
+            key_array[~found].tolist(),
+            key_array[found & ~unchanged].tolist(),
+            key_array[unchanged].tolist(),
+        )
+
+    def diff_rows(self, keys: list[str], hashes: list[str]) -> RowDiff:
+        inserted = list()
+        changed = list()
+        unchanged = list()
+        for key, row_hash in zip(keys, hashes):
+            if key not in self.hashes_by_key:
+                inserted.append(key)
+            elif self.hashes_by_key[key] != row_hash:
+                changed.append(key)
+            else:
+                unchanged.append(key)
+        return RowDiff(inserted, changed, unchanged)
+
+    def get_deleted(self, keys: set[str]) -> list[str]:
+        if not self.columnar:
+            return [key for key in self.hashes_by_key if key not in keys]
+        return self.keys[~numpy.isin(self.keys, list(keys))].tolist()
@@ -0,0 +1,109 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from form.data_warehouse import (
+    SqliteBackend,
+    get_row_fingerprint,
+    set_backend,
+    stream_query,
+)
+from form.diff import RowSnapshot, numpy
+from form.models import Section, SectionRow
+
+
+class Command(BaseCommand):
+    help = "Compare the columnar section diff with the row-at-a-time diff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--terms", type=int, nargs="+", help="Terms to diff (default: sync terms)"
+        )
+        parser.add_argument(
+            "--load",
+            metavar="PATH",
+            help="Read sections from a snapshot made with sync --extract",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Number of timed runs per method"
+        )
+
+    def diff_row_at_a_time(self, batches: list) -> tuple[int, int, int]:
+        inserted = changed = unchanged = 0
+        for rows in batches:
+            existing_sections = Section.objects.in_bulk([row[0] for row in rows])
+            for row in rows:
+                section = existing_sections.get(row[0])
+                if not section:
+                    inserted += 1
+                elif Section.is_unchanged(
+                    section, row, get_row_fingerprint(row), False
+                ):
+                    unchanged += 1
+                else:
+                    changed += 1
+        return inserted, changed, unchanged
+
+    def diff_columnar(
+        self, batches: list, terms: list[int], columnar: bool
+    ) -> tuple[int, int, int]:
+        snapshot = RowSnapshot.from_queryset(
+            Section.objects.filter(term__in=terms),
+            "section_code",
+            "fingerprint",
+            columnar,
+        )
+        inserted = changed = unchanged = 0
+        for rows in batches:
+            row_diff = snapshot.diff(
+                [row[0] for row in rows], [get_row_fingerprint(row) for row in rows]
+            )
+            inserted += len(row_diff.inserted)
+            changed += len(row_diff.changed)
+            unchanged += len(row_diff.unchanged)
+        return inserted, changed, unchanged
+
+    def time_method(self, name: str, method, repeat: int):
+        timings = list()
+        for _ in range(repeat):
+            start = perf_counter()
+            counts = method()
+            timings.append(perf_counter() - start)
+        inserted, changed, unchanged = counts
+        self.stdout.write(
+            f"{name:<16} {min(timings):>9.3f}s  inserted={inserted} changed={changed}"
+            f" unchanged={unchanged}"
+        )
+
+    def handle(self, *args, **options):
+        if options["load"]:
+            set_backend(SqliteBackend(options["load"]))
+        terms = Section.get_terms(options["terms"])
+        query, kwargs = Section.get_terms_query_and_bindings(terms)
+        batches = [
+            [
+                row
+                for row in rows
+                if row[0] and row[9] == Section.ACTIVE_SECTION_STATUS_CODE
+            ]
+            for rows in stream_query(query, kwargs, row_factory=SectionRow)
+        ]
+        row_count = sum(len(rows) for rows in batches)
+        self.stdout.write(f"Diffing {row_count} active sections for terms {terms}...")
+        repeat = options["repeat"]
+        self.time_method(
+            "row-at-a-time", lambda: self.diff_row_at_a_time(batches), repeat
+        )
+        self.time_method(
+            "dict lookup",
+            lambda: self.diff_columnar(batches, terms, columnar=False),
+            repeat,
+        )
+        if numpy is None:
+            self.stdout.write("SKIPPING columnar (numpy): NumPy is not installed")
+            return
+        self.time_method(
+            "columnar (numpy)",
+            lambda: self.diff_columnar(batches, terms, columnar=True),
+            repeat,
+        )
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from form.models import QueryStatistic
+
+ORDERINGS = {
+    "total": "-total_time",
+    "max": "-max_time",
+    "calls": "-calls",
+    "rows": "-rows",
+    "slow": "-slow_calls",
+}
+
+
+class Command(BaseCommand):
+    help = "Show aggregated Data Warehouse query statistics"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--order",
+            choices=ORDERINGS.keys(),
+            default="total",
+            help="Sort queries by this statistic",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=20, help="Number of queries to show"
+        )
+        parser.add_argument(
+            "--reset", action="store_true", help="Delete all collected statistics"
+        )
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            deleted, _ = QueryStatistic.objects.all().delete()
+            self.stdout.write(f"DELETED {deleted} query statistics")
+            return
+        statistics = QueryStatistic.objects.order_by(ORDERINGS[options["order"]])
+        statistics = statistics[: options["limit"]]
+        header = (
+            f"{'FINGERPRINT':<16} {'CALLS':>8} {'ROWS':>10} {'TOTAL (s)':>10}"
+            f" {'AVG (ms)':>9} {'MAX (ms)':>9} {'SLOW':>5}  QUERY"
+        )
+        self.stdout.write(header)
+        for statistic in statistics:
+            self.stdout.write(
+                f"{statistic.fingerprint:<16} {statistic.calls:>8}"
+                f" {statistic.rows:>10} {statistic.total_time:>10.2f}"
+                f" {statistic.average_time * 1000:>9.1f}"
+                f" {statistic.max_time * 1000:>9.1f} {statistic.slow_calls:>5} "
+                f" {statistic.query[:120]}"
+            )
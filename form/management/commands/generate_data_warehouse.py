@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from form.sqlite_warehouse import generate_data_warehouse
+
+
+class Command(BaseCommand):
+    help = "Generate a local SQLite Data Warehouse filled with synthetic data"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default="data_warehouse.sqlite3",
+            help="Path of the SQLite file to (re)create",
+        )
+        parser.add_argument(
+            "--sections",
+            type=int,
+            default=1000,
+            help="Number of sections to generate (e.g. 1000, 10000, 100000)",
+        )
+        parser.add_argument(
+            "--terms", type=int, nargs="*", help="Terms to generate sections for"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed for repeatable data"
+        )
+
+    def handle(self, *args, **options):
+        generate_data_warehouse(
+            options["path"], options["sections"], options["terms"], options["seed"]
+        )
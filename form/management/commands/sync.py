@@ -1,6 +1,9 @@
 from django.core.management.base import BaseCommand
 
+from config.config import DATA_WAREHOUSE_SYNC_CALL_TIMEOUT
+from form.data_warehouse import SqliteBackend, set_backend, set_call_timeout
 from form.models import ScheduleType, School, Section, Subject
+from form.sqlite_warehouse import extract_data_warehouse
 
 
 class Command(BaseCommand):
@@ -13,8 +16,48 @@ class Command(BaseCommand):
         parser.add_argument("--schools", action="store_true", help="Sync Schools")
         parser.add_argument("--subjects", action="store_true", help="Sync Subjects")
         parser.add_argument("--sections", action="store_true", help="Sync Sections")
+        parser.add_argument(
+            "--extract",
+            metavar="PATH",
+            help="Snapshot the Data Warehouse tables to a SQLite file and exit",
+        )
+        parser.add_argument(
+            "--load",
+            metavar="PATH",
+            help="Sync from a snapshot made with --extract instead of Oracle",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Sync sections in term and school partitions on N processes",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last unfinished section sync from its checkpoints",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Sync every term and school even if its sections are unchanged",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Apply section deletions and instructor removals above the limit",
+        )
 
     def handle(self, *args, **options):
+        extract_path = options["extract"]
+        load_path = options["load"]
+        if extract_path:
+            extract_data_warehouse(extract_path, Section.DEFAULT_TERMS)
+            if not load_path:
+                return
+        if load_path:
+            set_backend(SqliteBackend(load_path))
+        set_call_timeout(DATA_WAREHOUSE_SYNC_CALL_TIMEOUT)
         sync_schedule_types = options["schedule_types"]
         sync_schools = options["schools"]
         sync_subjects = options["subjects"]
@@ -29,4 +72,9 @@ class Command(BaseCommand):
         if sync_all or sync_subjects:
             Subject.sync_all()
         if sync_all or sync_sections:
-            Section.sync_all()
+            Section.sync_all(
+                workers=options["workers"],
+                resume=options["resume"],
+                full=options["full"],
+                force=options["force"],
+            )
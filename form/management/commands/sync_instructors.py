@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from config.config import DATA_WAREHOUSE_SYNC_CALL_TIMEOUT
+from form.data_warehouse import set_call_timeout
+from form.models import User
+
+
+class Command(BaseCommand):
+    help = "Pre-load instructors for upcoming terms from the Data Warehouse"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--terms",
+            type=int,
+            nargs="+",
+            help="Terms to load instructors for (default: current and next term)",
+        )
+
+    def handle(self, *args, **options):
+        set_call_timeout(DATA_WAREHOUSE_SYNC_CALL_TIMEOUT)
+        users = User.sync_instructors(options["terms"])
+        self.stdout.write(f"LOADED {len(users)} instructors")
@@ -0,0 +1,32 @@
+# Generated by Django 4.0.4 on 2026-10-18 04:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("form", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueryStatistic",
+            fields=[
+                (
+                    "fingerprint",
+                    models.CharField(max_length=16, primary_key=True, serialize=False),
+                ),
+                ("query", models.TextField()),
+                ("calls", models.IntegerField(default=0)),
+                ("rows", models.BigIntegerField(default=0)),
+                ("total_time", models.FloatField(default=0)),
+                ("max_time", models.FloatField(default=0)),
+                ("slow_calls", models.IntegerField(default=0)),
+                ("last_called_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["-total_time"],
+            },
+        ),
+    ]
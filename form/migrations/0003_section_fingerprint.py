@@ -0,0 +1,23 @@
+# Generated by Django 4.0.4 on 2026-10-18 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("form", "0002_querystatistic"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="section",
+            name="fingerprint",
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name="section",
+            name="instructors_fingerprint",
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+    ]
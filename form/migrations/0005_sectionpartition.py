@@ -0,0 +1,38 @@
+# Generated by Django 4.0.4 on 2026-10-18 05:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("form", "0004_syncrun_synccheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SectionPartition",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.IntegerField()),
+                ("school_code", models.CharField(max_length=10)),
+                ("row_count", models.IntegerField()),
+                ("row_hash", models.CharField(max_length=40)),
+                ("synced_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="sectionpartition",
+            constraint=models.UniqueConstraint(
+                fields=("term", "school_code"), name="unique_section_partition"
+            ),
+        ),
+    ]
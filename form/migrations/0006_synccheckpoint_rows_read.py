@@ -0,0 +1,18 @@
+# Generated by Django 4.0.4 on 2026-10-18 05:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("form", "0005_sectionpartition"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="synccheckpoint",
+            name="rows_read",
+            field=models.IntegerField(default=0),
+        ),
+    ]
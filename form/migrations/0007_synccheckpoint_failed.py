@@ -0,0 +1,18 @@
+# Generated by Django 4.0.4 on 2026-10-18 05:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("form", "0006_synccheckpoint_rows_read"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="synccheckpoint",
+            name="failed",
+            field=models.IntegerField(default=0),
+        ),
+    ]
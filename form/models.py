@@ -1,17 +1,25 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from logging import getLogger
+from multiprocessing import get_context
 from time import sleep
-from typing import Optional, Union, cast
+from typing import Iterable, NamedTuple, Optional, Union, cast
 
 from canvasapi.course import Course
 from canvasapi.tab import Tab
 from django.contrib.auth.models import AbstractUser
+from django.db import IntegrityError, connections, transaction
 from django.db.models import (
     CASCADE,
+    BigIntegerField,
     BooleanField,
     CharField,
     DateTimeField,
+    F,
+    FloatField,
     ForeignKey,
     IntegerField,
     ManyToManyField,
@@ -23,6 +31,10 @@ from django.db.models import (
     TextField,
     UniqueConstraint,
 )
+from django.db.models.functions import Greatest, Now
+from django.utils import timezone
+
+from config.config import SYNC_MAX_DELETE_FRACTION
 
 from .canvas import (
     create_course_section,
@@ -36,13 +48,192 @@ from .canvas import (
     get_user_canvas_sites,
     update_or_create_canvas_course,
 )
-from .data_warehouse import execute_query
+from .data_warehouse import (
+    DataWarehouseError,
+    execute_query,
+    get_in_list_condition,
+    get_in_list_queries,
+    get_row_fingerprint,
+    is_data_warehouse_available,
+    query_statistics,
+    stream_query,
+)
+from .diff import RowSnapshot
 from .terms import CURRENT_TERM, NEXT_TERM
 
 logger = getLogger(__name__)
 
 
+def save_objects(objects: list, existing_pks: set, update_fields: list) -> list:
+    saved_objects = list()
+    for model_object in objects:
+        try:
+            with transaction.atomic():
+                if model_object.pk in existing_pks:
+                    model_object.save(update_fields=update_fields)
+                else:
+                    model_object.save(force_insert=True)
+            saved_objects.append(model_object)
+        except Exception as error:
+            logger.error(f"FAILED to update or create '{model_object}': {error}")
+    return saved_objects
+
+
+def update_or_create_objects(
+    model, values: dict, update_fields: list, field_name="pk"
+) -> dict:
+    existing_objects = model.objects.in_bulk(list(values), field_name=field_name)
+    new_objects = list()
+    updated_objects = list()
+    for key, object_values in values.items():
+        model_object = existing_objects.get(key)
+        if not model_object:
+            new_objects.append(model(**{field_name: key}, **object_values))
+        elif any(
+            getattr(model_object, field) != value
+            for field, value in object_values.items()
+        ):
+            for field, value in object_values.items():
+                setattr(model_object, field, value)
+            updated_objects.append(model_object)
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(new_objects)
+            model.objects.bulk_update(updated_objects, update_fields)
+    except Exception as error:
+        logger.warning(
+            f"FAILED to bulk update or create {model._meta.verbose_name_plural}:"
+            f" {error}. Saving individually..."
+        )
+        existing_pks = {model_object.pk for model_object in existing_objects.values()}
+        saved_objects = save_objects(
+            new_objects + updated_objects, existing_pks, update_fields
+        )
+        new_objects = [
+            model_object
+            for model_object in new_objects
+            if model_object in saved_objects
+        ]
+        updated_objects = [
+            model_object
+            for model_object in updated_objects
+            if model_object in saved_objects
+        ]
+    logger.info(
+        f"ADDED {len(new_objects)} and UPDATED {len(updated_objects)}"
+        f" {model._meta.verbose_name_plural}"
+    )
+    return existing_objects | {
+        getattr(model_object, field_name): model_object for model_object in new_objects
+    }
+
+
+def get_relation_changes(
+    through,
+    source: str,
+    target: str,
+    relations: set,
+    existing_relations: QuerySet,
+    source_ids: Optional[set] = None,
+) -> tuple[list, list]:
+    source_field = f"{source}_id"
+    target_field = f"{target}_id"
+    existing_relation_ids = {
+        (source_id, target_id): relation_id
+        for relation_id, source_id, target_id in existing_relations.values_list(
+            "id", source_field, target_field
+        )
+        if source_ids is None or source_id in source_ids
+    }
+    removed_relations = [
+        relation_id
+        for relation, relation_id in existing_relation_ids.items()
+        if relation not in relations
+    ]
+    added_relations = [
+        through(**{source_field: source_id, target_field: target_id})
+        for source_id, target_id in relations - existing_relation_ids.keys()
+    ]
+    return added_relations, removed_relations
+
+
+def save_relation_changes(through, added_relations: list, removed_relations: list):
+    with transaction.atomic():
+        through.objects.filter(id__in=removed_relations).delete()
+        through.objects.bulk_create(added_relations)
+
+
+def sync_relations(
+    through,
+    source: str,
+    target: str,
+    relations: set,
+    existing_relations: QuerySet,
+    source_ids: Optional[set] = None,
+) -> tuple[int, int]:
+    added_relations, removed_relations = get_relation_changes(
+        through, source, target, relations, existing_relations, source_ids
+    )
+    save_relation_changes(through, added_relations, removed_relations)
+    return len(added_relations), len(removed_relations)
+
+
+class UserRow(NamedTuple):
+    first_name: Optional[str]
+    last_name: Optional[str]
+    penn_id: Optional[int]
+    email: Optional[str]
+
+
+class InstructorRow(NamedTuple):
+    pennkey: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    penn_id: int
+    email: Optional[str]
+    primary_instructor: Optional[str]
+
+
+class SectionInstructorRow(NamedTuple):
+    section_code: str
+    pennkey: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    penn_id: int
+    email: Optional[str]
+    primary_instructor: Optional[str]
+
+
+class SectionRow(NamedTuple):
+    section_code: str
+    section_id: str
+    school: str
+    subject: str
+    course_num: str
+    section_num: str
+    term: int
+    title: Optional[str]
+    schedule_type: str
+    section_status: str
+    primary_course_id: Optional[str]
+    primary_section_id: Optional[str]
+    primary_subject: Optional[str]
+    course_id: str
+    xlist_family: Optional[str]
+
+
 class User(AbstractUser):
+    SYNC_FIELDS = ["first_name", "last_name", "penn_id", "email"]
+    QUERY = """
+            SELECT pennkey, first_name, last_name, penn_id, email_address
+            FROM employee_general
+            """
+    INSTRUCTORS_QUERY = """
+            SELECT DISTINCT employee.pennkey
+            FROM dwngss_ps.crse_sect_instructor instructor
+            JOIN employee_general_v employee
+            ON instructor.instructor_penn_id = employee.penn_id
+            """
     penn_id = IntegerField(unique=True, null=True)
 
     def __str__(self):
@@ -50,7 +241,10 @@ class User(AbstractUser):
 
     def save(self, *args, **kwargs):
         if self._state.adding and not self.penn_id:
-            self.sync_dw_info()
+            try:
+                self.sync_dw_info()
+            except DataWarehouseError:
+                logger.warning(f"SKIPPING Data Warehouse info for '{self.username}'")
         super().save(*args, **kwargs)
 
     @staticmethod
@@ -68,7 +262,7 @@ class User(AbstractUser):
                 FROM employee_general
                 WHERE pennkey = :pennkey
                 """
-        cursor = execute_query(query, {"pennkey": pennkey})
+        cursor = execute_query(query, {"pennkey": pennkey}, row_factory=UserRow)
         for first_name, last_name, penn_id, email in cursor:
             first_name = first_name.title() if first_name else ""
             cls.log_field(pennkey, "first name", first_name)
@@ -97,12 +291,72 @@ class User(AbstractUser):
                 logger.info(f"ADDED {user_object}")
                 return user_object
 
+    @classmethod
+    def bulk_update_or_create(cls, user_values: dict[str, dict]) -> dict:
+        return update_or_create_objects(
+            cls, user_values, cls.SYNC_FIELDS, field_name="username"
+        )
+
+    @classmethod
+    def sync_users(cls, pennkeys) -> dict:
+        pennkeys = sorted({pennkey for pennkey in pennkeys if pennkey})
+        logger.info(f"Getting {len(pennkeys)} users' info from Data Warehouse...")
+        user_values = dict()
+        queries = get_in_list_queries(cls.QUERY, "pennkey", pennkeys, keyword="WHERE")
+        for query, kwargs in queries:
+            for pennkey, first_name, last_name, penn_id, email in execute_query(
+                query, kwargs
+            ):
+                user_values[pennkey] = {
+                    "first_name": first_name.title() if first_name else "",
+                    "last_name": last_name.title() if last_name else "",
+                    "penn_id": penn_id,
+                    "email": email.strip().lower() if email else "",
+                }
+        missing_pennkeys = set(pennkeys) - user_values.keys()
+        if missing_pennkeys:
+            logger.warning(
+                f"{len(missing_pennkeys)} users NOT FOUND in Data Warehouse:"
+                f" {sorted(missing_pennkeys)}"
+            )
+        return cls.bulk_update_or_create(user_values)
+
+    @classmethod
+    def sync_instructors(cls, terms: Optional[Union[int, list[int]]] = None) -> dict:
+        terms = Section.get_terms(terms)
+        logger.info(f"Syncing instructors for terms {terms}...")
+        condition, kwargs = get_in_list_condition("instructor.term", terms)
+        query = f"{cls.INSTRUCTORS_QUERY} WHERE {condition}"
+        pennkeys = {pennkey for pennkey, in execute_query(query, kwargs)}
+        return cls.sync_users(pennkeys)
+
     @classmethod
     def get_user(cls, pennkey: str):
         try:
             return cls.objects.get(username=pennkey)
         except Exception:
-            return cls.sync_user(pennkey)
+            try:
+                return cls.sync_user(pennkey)
+            except DataWarehouseError:
+                logger.warning(
+                    f"FAILED to find '{pennkey}' (Data Warehouse unavailable)"
+                )
+                return None
+
+    @classmethod
+    def get_users(cls, pennkeys) -> dict:
+        pennkeys = list(pennkeys)
+        users = cls.objects.in_bulk(pennkeys, field_name="username")
+        missing_pennkeys = set(pennkeys) - users.keys()
+        if missing_pennkeys:
+            try:
+                users.update(cls.sync_users(missing_pennkeys))
+            except DataWarehouseError:
+                logger.warning(
+                    f"FAILED to find {len(missing_pennkeys)} users (Data Warehouse"
+                    " unavailable)"
+                )
+        return users
 
     def sync_dw_info(self):
         self.sync_user(self.username, self)
@@ -124,9 +378,19 @@ class User(AbstractUser):
         return canvas_user.id
 
     def sync_sections(self):
-        if not self.penn_id:
-            self.sync_dw_info()
-        return Section.sync_instructor_sections(self.penn_id)
+        if not is_data_warehouse_available():
+            logger.warning(
+                f"Data Warehouse unavailable. Using stored sections for {self}..."
+            )
+            return
+        try:
+            if not self.penn_id:
+                self.sync_dw_info()
+            return Section.sync_instructor_sections(self.penn_id)
+        except DataWarehouseError:
+            logger.warning(
+                f"FAILED to sync sections. Using stored sections for {self}..."
+            )
 
     @staticmethod
     def sort_sections_by_requested(section) -> bool:
@@ -179,23 +443,21 @@ class ScheduleType(Model):
         return f"{self.sched_type_desc} ({self.sched_type_code})"
 
     @classmethod
-    def update_or_create(cls, query: str, kwargs: Optional[dict] = None):
-        cursor = execute_query(query, kwargs)
-        schedule_type = None
+    def update_or_create(cls, query: str, kwargs: Optional[dict] = None, cache=False):
+        cursor = execute_query(query, kwargs, cache)
+        schedule_type_values = dict()
         for sched_type_code, sched_type_desc in cursor:
-            try:
-                schedule_type, created = cls.objects.update_or_create(
-                    sched_type_code=sched_type_code,
-                    defaults={"sched_type_desc": sched_type_desc},
-                )
-                action = "ADDED" if created else "UPDATED"
-                logger.info(f"{action} {schedule_type}")
-            except Exception as error:
-                logger.error(
-                    f"FAILED to update or create schedule type '{sched_type_code}':"
-                    f" {error}"
+            if not sched_type_code:
+                logger.warning(
+                    f"SKIPPING schedule type '{sched_type_desc}' (missing schedule"
+                    " type code)"
                 )
-        return schedule_type
+                continue
+            schedule_type_values[sched_type_code] = {"sched_type_desc": sched_type_desc}
+        schedule_types = update_or_create_objects(
+            cls, schedule_type_values, ["sched_type_desc"]
+        )
+        return schedule_types.get(next(reversed(schedule_type_values), None))
 
     @classmethod
     def sync_all(cls):
@@ -203,17 +465,25 @@ class ScheduleType(Model):
         cls.update_or_create(cls.QUERY)
 
     @classmethod
-    def sync_schedule_type(cls, sched_type_code: str):
+    def sync_schedule_type(cls, sched_type_code: str, cache=False):
         query = f"{cls.QUERY} WHERE sched_type_code = :sched_type_code"
         kwargs = {"sched_type_code": sched_type_code}
-        return cls.update_or_create(query, kwargs)
+        return cls.update_or_create(query, kwargs, cache)
+
+    @classmethod
+    def sync_schedule_types(cls, sched_type_codes):
+        queries = get_in_list_queries(
+            cls.QUERY, "sched_type_code", sorted(sched_type_codes), keyword="WHERE"
+        )
+        for query, kwargs in queries:
+            cls.update_or_create(query, kwargs)
 
     @classmethod
     def get_schedule_type(cls, sched_type_code: str):
         try:
             return cls.objects.get(sched_type_code=sched_type_code)
         except Exception:
-            return cls.sync_schedule_type(sched_type_code)
+            return cls.sync_schedule_type(sched_type_code, cache=True)
 
 
 class School(Model):
@@ -240,18 +510,33 @@ class School(Model):
     def __str__(self):
         return f"{self.school_desc_long} ({self.school_code})"
 
+    loaded_visible: Optional[bool] = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        school = super().from_db(db, field_names, values)
+        school.loaded_visible = school.__dict__.get("visible")
+        return school
+
     def save(self, *args, **kwargs):
-        for subject in self.get_subjects():
-            subject.visible = self.visible
-            subject.save()
         super().save(*args, **kwargs)
+        if self.visible != self.loaded_visible:
+            self.update_subjects_visible()
+            self.loaded_visible = self.visible
 
     def get_subjects(self):
         return Subject.objects.filter(school=self)
 
+    def update_subjects_visible(self) -> int:
+        return (
+            self.get_subjects()
+            .exclude(visible=self.visible)
+            .update(visible=self.visible)
+        )
+
     def toggle_visible(self):
         self.visible = not self.visible
-        self.save()
+        self.save(update_fields=["visible"])
 
     def get_canvas_school_name(self) -> str:
         if self.school_code == self.VETERINARY_MEDICINE_CODE:
@@ -261,16 +546,28 @@ class School(Model):
         else:
             return self.school_desc_long.replace("&", "and")
 
-    def get_canvas_sub_account(self):
-        accounts = get_all_canvas_accounts()
+    def get_canvas_sub_account_id(self, accounts: list) -> Optional[int]:
         school_name = self.get_canvas_school_name()
         account_ids = (
             account.id for account in accounts if account.name in school_name
         )
-        account_id = next(account_ids, None)
-        if account_id:
-            self.canvas_sub_account_id = account_id
-            self.save()
+        return next(account_ids, None)
+
+    @classmethod
+    def sync_canvas_sub_accounts(cls, schools: list):
+        try:
+            accounts = get_all_canvas_accounts()
+        except Exception as error:
+            logger.error(f"FAILED to fetch Canvas sub-accounts: {error}")
+            return
+        updated_schools = list()
+        for school in schools:
+            account_id = school.get_canvas_sub_account_id(accounts)
+            if account_id and account_id != school.canvas_sub_account_id:
+                school.canvas_sub_account_id = account_id
+                updated_schools.append(school)
+        cls.objects.bulk_update(updated_schools, ["canvas_sub_account_id"])
+        logger.info(f"UPDATED Canvas sub-accounts for {len(updated_schools)} schools")
 
     @classmethod
     def is_canvas_school(cls, school_code: str) -> bool:
@@ -279,28 +576,31 @@ class School(Model):
         )
 
     @classmethod
-    def update_or_create(cls, query: str, kwargs: Optional[dict] = None):
-        cursor = execute_query(query, kwargs)
-        school = None
+    def update_or_create(cls, query: str, kwargs: Optional[dict] = None, cache=False):
+        cursor = execute_query(query, kwargs, cache)
+        school_values = dict()
         for school_code, school_desc_long in cursor:
+            if not school_code:
+                logger.warning(
+                    f"SKIPPING school '{school_desc_long}' (missing school code)"
+                )
+                continue
             if not cls.is_canvas_school(school_code):
                 logger.info(f"SKIPPING school '{school_desc_long}' (not in Canvas)")
                 continue
-            try:
-                school, created = cls.objects.update_or_create(
-                    school_code=school_code,
-                    defaults={"school_desc_long": school_desc_long},
-                )
-                school.get_canvas_sub_account()
-                if "wharton" in school_desc_long.lower():
-                    school.toggle_visible()
-                action = "ADDED" if created else "UPDATED"
-                logger.info(f"{action} {school}")
-            except Exception as error:
-                logger.error(
-                    f"FAILED to update or create school '{school_code}': {error}"
-                )
-        return school
+            school_values[school_code] = {"school_desc_long": school_desc_long}
+        existing_school_codes = set(
+            cls.objects.filter(pk__in=list(school_values)).values_list("pk", flat=True)
+        )
+        for school_code, values in school_values.items():
+            if (
+                school_code not in existing_school_codes
+                and "wharton" in values["school_desc_long"].lower()
+            ):
+                values["visible"] = False
+        schools = update_or_create_objects(cls, school_values, ["school_desc_long"])
+        cls.sync_canvas_sub_accounts(list(schools.values()))
+        return schools.get(next(reversed(school_values), None))
 
     @classmethod
     def sync_all(cls):
@@ -308,17 +608,32 @@ class School(Model):
         cls.update_or_create(cls.QUERY)
 
     @classmethod
-    def sync_school(cls, school_code: str):
+    def sync_school(cls, school_code: str, cache=False):
         query = f"{cls.QUERY} WHERE school_code = :school_code"
         kwargs = {"school_code": school_code}
-        return cls.update_or_create(query, kwargs)
+        return cls.update_or_create(query, kwargs, cache)
+
+    @classmethod
+    def sync_schools(cls, school_codes):
+        queries = get_in_list_queries(
+            cls.QUERY, "school_code", sorted(school_codes), keyword="WHERE"
+        )
+        for query, kwargs in queries:
+            cls.update_or_create(query, kwargs)
 
     @classmethod
     def get_school(cls, school_code: str):
         try:
             school = cls.objects.get(school_code=school_code)
         except Exception:
-            school = cls.sync_school(school_code)
+            try:
+                school = cls.sync_school(school_code, cache=True)
+            except DataWarehouseError:
+                logger.warning(
+                    f"FAILED to find school '{school_code}' (Data Warehouse"
+                    " unavailable)"
+                )
+                school = None
         return school
 
 
@@ -344,41 +659,58 @@ class Subject(Model):
         return f"{self.subject_code} ({name})"
 
     @classmethod
-    def update_or_create(cls, query: str, kwargs: Optional[dict] = None):
-        cursor = execute_query(query, kwargs)
-        subject = None
+    def update_or_create(
+        cls,
+        query: str,
+        kwargs: Optional[dict] = None,
+        cache=False,
+        context: Optional["SyncContext"] = None,
+    ):
+        cursor = list(execute_query(query, kwargs, cache))
+        context = context or SyncContext()
+        context.load_schools({school_code for _, _, school_code in cursor})
+        subject_values = dict()
         for subject_code, subject_desc_long, school_code in cursor:
-            try:
-                school = School.get_school(school_code)
-                subject, created = cls.objects.update_or_create(
-                    subject_code=subject_code,
-                    defaults={"subject_desc_long": subject_desc_long, "school": school},
-                )
-                action = "ADDED" if created else "UPDATED"
-                logger.info(f"{action} {subject}")
-            except Exception as error:
-                logger.error(
-                    f"FAILED to update or create subject '{subject_code}': {error}"
+            if not subject_code:
+                logger.warning(
+                    f"SKIPPING subject '{subject_desc_long}' (missing subject code)"
                 )
-        return subject
+                continue
+            school = context.get_school(school_code)
+            subject_values[subject_code] = {
+                "subject_desc_long": subject_desc_long,
+                "school_id": school.pk if school else None,
+            }
+        subjects = update_or_create_objects(
+            cls, subject_values, ["subject_desc_long", "school"]
+        )
+        return subjects.get(next(reversed(subject_values), None))
 
     @classmethod
     def sync_all(cls):
         logger.info("Syncing Subjects...")
-        cls.update_or_create(cls.QUERY)
+        cls.update_or_create(cls.QUERY, context=SyncContext(preload=True))
 
     @classmethod
-    def sync_subject(cls, subject_code: str):
+    def sync_subject(cls, subject_code: str, cache=False):
         query = f"{cls.QUERY} WHERE subject_code = :subject_code"
         kwargs = {"subject_code": subject_code}
-        return cls.update_or_create(query, kwargs)
+        return cls.update_or_create(query, kwargs, cache)
+
+    @classmethod
+    def sync_subjects(cls, subject_codes, context: Optional["SyncContext"] = None):
+        queries = get_in_list_queries(
+            cls.QUERY, "subject_code", sorted(subject_codes), keyword="WHERE"
+        )
+        for query, kwargs in queries:
+            cls.update_or_create(query, kwargs, context=context)
 
     @classmethod
     def get_subject(cls, subject_code: str):
         try:
             return cls.objects.get(subject_code=subject_code)
         except Exception:
-            return cls.sync_subject(subject_code)
+            return cls.sync_subject(subject_code, cache=True)
 
     @classmethod
     def get_subjects_as_choices(cls) -> list[tuple[str, str]]:
@@ -387,27 +719,75 @@ class Subject(Model):
         return cast(list, [("", "---------")]) + subjects
 
 
+class SyncContext:
+    def __init__(self, preload=False):
+        self.schools: dict[str, Optional[School]] = dict()
+        self.subjects: dict[str, Optional[Subject]] = dict()
+        self.schedule_types: dict[str, Optional[ScheduleType]] = dict()
+        self.section_codes: set[str] = set()
+        self.canceled_section_codes: set[str] = set()
+        self.counts = {
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "deleted": 0,
+            "failed": 0,
+        }
+        self.primary_section_ids: dict[str, tuple] = dict()
+        self.snapshot: Optional[RowSnapshot] = None
+        if preload:
+            self.schools.update(School.objects.in_bulk())
+            self.subjects.update(Subject.objects.in_bulk())
+            self.schedule_types.update(ScheduleType.objects.in_bulk())
+
+    def load(self, model, objects: dict, codes: set):
+        codes = {code for code in codes if code} - objects.keys()
+        if not codes:
+            return
+        objects.update(model.objects.in_bulk(list(codes)))
+        missing_codes = codes - objects.keys()
+        if missing_codes:
+            model_name = model._meta.verbose_name_plural
+            logger.info(f"Fetching {len(missing_codes)} {model_name}...")
+            sync_method = {
+                School: School.sync_schools,
+                Subject: partial(Subject.sync_subjects, context=self),
+                ScheduleType: ScheduleType.sync_schedule_types,
+            }[model]
+            sync_method(missing_codes)
+            objects.update(model.objects.in_bulk(list(missing_codes)))
+        objects.update({code: None for code in codes - objects.keys()})
+
+    def load_schools(self, school_codes: set):
+        self.load(School, self.schools, school_codes)
+
+    def load_subjects(self, subject_codes: set):
+        self.load(Subject, self.subjects, subject_codes)
+
+    def load_schedule_types(self, sched_type_codes: set):
+        self.load(ScheduleType, self.schedule_types, sched_type_codes)
+
+    def load_section_rows(self, rows):
+        rows = list(rows)
+        self.load_schools({row[2] for row in rows})
+        self.load_subjects({row[3] for row in rows} | {row[12] for row in rows})
+        self.load_schedule_types({row[8] for row in rows})
+
+    def get_school(self, school_code: str) -> Optional[School]:
+        return self.schools.get(school_code)
+
+    def get_subject(self, subject_code: str) -> Optional[Subject]:
+        return self.subjects.get(subject_code)
+
+    def get_schedule_type(self, sched_type_code: str) -> Optional[ScheduleType]:
+        return self.schedule_types.get(sched_type_code)
+
+
 class Section(Model):
     RELATED_NAME = "sections"
     ACTIVE_SECTION_STATUS_CODE = "A"
     LECTURE_CODE = "LEC"
-    QUERY = """
-            SELECT
-                section_id || term,
-                section_id,
-                school,
-                subject,
-                course_num,
-                section_num,
-                term,
-                title,
-                schedule_type,
-                section_status,
-                primary_course_id,
-                primary_section_id,
-                primary_subject,
-                course_id,
-                xlist_family
+    QUERY_FILTER = """
             FROM dwngss_ps.crse_section section
             WHERE schedule_type NOT IN (
                 'MED',
@@ -427,8 +807,89 @@ class Section(Model):
             )
             AND school NOT IN ('W', 'L', 'P')
             """
-    QUERY_SECTION_ID = f"{QUERY} AND term = :term AND section_id = :section_id"
+    QUERY = f"""
+            SELECT
+                section_id || term,
+                section_id,
+                school,
+                subject,
+                course_num,
+                section_num,
+                term,
+                title,
+                schedule_type,
+                section_status,
+                primary_course_id,
+                primary_section_id,
+                primary_subject,
+                course_id,
+                xlist_family
+            {QUERY_FILTER}"""
+    KEYS_QUERY = f"""
+            SELECT
+                section_id || term,
+                section_id,
+                primary_section_id,
+                term,
+                section_status
+            {QUERY_FILTER}"""
+    PARTITION_FINGERPRINTS_QUERY = f"""
+            SELECT
+                term,
+                school,
+                COUNT(*),
+                SUM(
+                    ORA_HASH(
+                        COALESCE(section_id, '-') || '|' ||
+                        COALESCE(subject, '-') || '|' ||
+                        COALESCE(course_num, '-') || '|' ||
+                        COALESCE(section_num, '-') || '|' ||
+                        COALESCE(title, '-') || '|' ||
+                        COALESCE(schedule_type, '-') || '|' ||
+                        COALESCE(section_status, '-') || '|' ||
+                        COALESCE(primary_course_id, '-') || '|' ||
+                        COALESCE(primary_section_id, '-') || '|' ||
+                        COALESCE(primary_subject, '-') || '|' ||
+                        COALESCE(course_id, '-') || '|' ||
+                        COALESCE(xlist_family, '-')
+                    )
+                )
+            {QUERY_FILTER}"""
+    PARTITIONS_QUERY = f"""
+            SELECT DISTINCT term, school, subject, primary_subject, schedule_type
+            {QUERY_FILTER}"""
+    QUERY_TERM = f"{QUERY} AND term = :term"
+    QUERY_SECTION_ID = f"{QUERY_TERM} AND section_id = :section_id"
+    INSTRUCTORS_QUERY = """
+            SELECT
+                instructor.section_id || instructor.term,
+                employee.pennkey,
+                instructor.instructor_first_name,
+                instructor.instructor_last_name,
+                instructor.instructor_penn_id,
+                instructor.instructor_email,
+                instructor.primary_instructor
+            FROM dwngss_ps.crse_sect_instructor instructor
+            JOIN employee_general_v employee
+            ON instructor.instructor_penn_id = employee.penn_id
+            """
     DEFAULT_TERMS = [CURRENT_TERM, NEXT_TERM]
+    SYNC_FIELDS = [
+        "section_id",
+        "school",
+        "subject",
+        "course_num",
+        "section_num",
+        "term",
+        "title",
+        "schedule_type",
+        "primary_course_id",
+        "primary_section",
+        "primary_subject",
+        "xlist_family",
+        "fingerprint",
+        "updated_at",
+    ]
     section_code = CharField(max_length=150, primary_key=True, editable=False)
     section_id = CharField(max_length=150, editable=False)
     school = ForeignKey(School, on_delete=CASCADE, related_name=RELATED_NAME)
@@ -450,6 +911,8 @@ class Section(Model):
     primary_section = ForeignKey("self", on_delete=CASCADE, blank=True, null=True)
     primary_subject = ForeignKey(Subject, on_delete=CASCADE)
     xlist_family = CharField(max_length=255, blank=True, null=True, editable=False)
+    fingerprint = CharField(max_length=16, blank=True, editable=False)
+    instructors_fingerprint = CharField(max_length=16, blank=True, editable=False)
     also_offered_as = ManyToManyField("self", blank=True)
     course_sections = ManyToManyField("self", blank=True)
     requested = BooleanField(default=False)
@@ -492,7 +955,10 @@ class Section(Model):
                 AND term = :term
                 """
         kwargs = {"section_id": f"{self.section_id}", "term": self.term}
-        cursor = execute_query(query, kwargs)
+        cursor = list(execute_query(query, kwargs, row_factory=InstructorRow))
+        fingerprint = self.get_instructors_fingerprint(row for row in cursor if row[0])
+        if self.instructors_fingerprint == fingerprint:
+            return
         instructors = list()
         for (
             pennkey,
@@ -525,18 +991,185 @@ class Section(Model):
                     f"FAILED to update or create instructor '{pennkey}': {error}"
                 )
         self.instructors.set(instructors)
+        self.instructors_fingerprint = fingerprint
+        self.save(update_fields=["instructors_fingerprint"])
+
+    @staticmethod
+    def get_instructors_fingerprint(rows: Iterable) -> str:
+        return get_row_fingerprint(sorted(repr(tuple(row)) for row in rows))
 
     @classmethod
-    def sync_all_section_instructors(cls):
-        pass
+    def sync_all_section_instructors(
+        cls, terms: Optional[Union[int, list[int]]] = None, force=False
+    ):
+        terms = cls.get_terms(terms)
+        logger.info(f"Syncing section instructors for terms {terms}...")
+        condition, kwargs = get_in_list_condition("instructor.term", terms)
+        query = f"{cls.INSTRUCTORS_QUERY} WHERE {condition}"
+        section_rows: dict[str, list[SectionInstructorRow]] = dict()
+        for rows in stream_query(query, kwargs, row_factory=SectionInstructorRow):
+            for row in rows:
+                if row[1]:
+                    section_rows.setdefault(row[0], list()).append(row)
+        sections = cls.objects.filter(term__in=terms).only(
+            "section_code", "primary_instructor", "instructors_fingerprint"
+        )
+        section_codes = set()
+        changed_sections = dict()
+        for section in sections:
+            section_codes.add(section.section_code)
+            fingerprint = cls.get_instructors_fingerprint(
+                row[1:] for row in section_rows.get(section.section_code, list())
+            )
+            if section.instructors_fingerprint != fingerprint:
+                section.instructors_fingerprint = fingerprint
+                changed_sections[section.section_code] = section
+        if not section_rows and section_codes:
+            logger.error(
+                f"ABORTING section instructor sync for terms {terms}: no instructors"
+                f" found for {len(section_codes)} stored sections"
+            )
+            return
+        user_values = dict()
+        primary_instructors = dict()
+        section_instructors: dict[str, set[str]] = dict()
+        for section_code in set(changed_sections) | (set(section_rows) - section_codes):
+            for (
+                _,
+                pennkey,
+                first_name,
+                last_name,
+                penn_id,
+                email,
+                primary_instructor,
+            ) in section_rows.get(section_code, list()):
+                user_values[pennkey] = {
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "penn_id": penn_id,
+                    "email": email or "",
+                }
+                if primary_instructor == "Y":
+                    primary_instructors[section_code] = pennkey
+                else:
+                    section_instructors.setdefault(section_code, set()).add(pennkey)
+        users = User.bulk_update_or_create(user_values)
+        updated_sections = list(changed_sections.values())
+        for section in updated_sections:
+            user = users.get(primary_instructors.get(section.section_code))
+            if user:
+                section.primary_instructor = user
+        instructors = {
+            (section_code, users[pennkey].pk)
+            for section_code, pennkeys in section_instructors.items()
+            if section_code in changed_sections
+            for pennkey in pennkeys
+            if pennkey in users
+        }
+        SectionInstructor = cls.instructors.through
+        existing_instructors = SectionInstructor.objects.filter(section__term__in=terms)
+        added_instructors, removed_instructors = get_relation_changes(
+            SectionInstructor,
+            "section",
+            "user",
+            instructors,
+            existing_instructors,
+            set(changed_sections),
+        )
+        removed_count = len(removed_instructors)
+        existing_count = existing_instructors.count()
+        if not force and removed_count > SYNC_MAX_DELETE_FRACTION * existing_count:
+            logger.error(
+                f"HOLDING BACK removal of {removed_count} of {existing_count} section"
+                f" instructors for terms {terms} (more than"
+                f" {SYNC_MAX_DELETE_FRACTION:.0%}). Sync with --force to apply them."
+            )
+            held_section_codes = set(
+                SectionInstructor.objects.filter(
+                    id__in=removed_instructors
+                ).values_list("section_id", flat=True)
+            )
+            for section in updated_sections:
+                if section.section_code in held_section_codes:
+                    section.instructors_fingerprint = ""
+            removed_instructors = list()
+            removed_count = 0
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                updated_sections, ["primary_instructor", "instructors_fingerprint"]
+            )
+            save_relation_changes(
+                SectionInstructor, added_instructors, removed_instructors
+            )
+        logger.info(
+            f"UPDATED instructors for {len(updated_sections)} sections, ADDED"
+            f" {len(added_instructors)} and REMOVED {removed_count} section"
+            " instructors"
+        )
+
+    @classmethod
+    def sync_all_related_sections(cls, terms: Optional[Union[int, list[int]]] = None):
+        terms = cls.get_terms(terms)
+        logger.info(f"Syncing related sections for terms {terms}...")
+        xlist_families: dict[tuple, list[str]] = dict()
+        courses: dict[tuple, list[str]] = dict()
+        sections = cls.objects.filter(term__in=terms).values_list(
+            "section_code", "term", "xlist_family", "subject_id", "course_num"
+        )
+        for section_code, term, xlist_family, subject_code, course_num in sections:
+            if xlist_family:
+                xlist_families.setdefault((term, xlist_family), list()).append(
+                    section_code
+                )
+            courses.setdefault((term, subject_code, course_num), list()).append(
+                section_code
+            )
+        also_offered_as = {
+            (section_code, related_section_code)
+            for section_codes in xlist_families.values()
+            for section_code in section_codes
+            for related_section_code in section_codes
+        }
+        course_sections = {
+            (section_code, related_section_code)
+            for section_codes in courses.values()
+            for section_code in section_codes
+            for related_section_code in section_codes
+            if section_code != related_section_code
+        }
+        term_filter = Q(from_section__term__in=terms) | Q(to_section__term__in=terms)
+        for field, relations in (
+            (cls.also_offered_as, also_offered_as),
+            (cls.course_sections, course_sections),
+        ):
+            through = field.through
+            added, removed = sync_relations(
+                through,
+                "from_section",
+                "to_section",
+                relations,
+                through.objects.filter(term_filter),
+            )
+            logger.info(
+                f"ADDED {added} and REMOVED {removed} {field.field.name} relations"
+            )
 
     def get_related_sections(self, cursor) -> list:
-        related_sections = list()
-        for section_id in cursor:
-            section_id = next(iter(section_id))
-            section = self.get_section(section_id, self.term, sync_related_data=False)
-            if section:
-                related_sections.append(section)
+        section_ids = {next(iter(section_id)) for section_id in cursor}
+        if not section_ids:
+            return list()
+        related_sections = list(
+            Section.objects.filter(section_id__in=section_ids, term=self.term)
+        )
+        found_section_ids = {section.section_id for section in related_sections}
+        missing_section_ids = section_ids - found_section_ids
+        if missing_section_ids:
+            self.sync_sections(missing_section_ids, self.term, sync_related_data=False)
+            related_sections.extend(
+                Section.objects.filter(
+                    section_id__in=missing_section_ids, term=self.term
+                )
+            )
         return related_sections
 
     def sync_also_offered_as_sections(self):
@@ -566,24 +1199,62 @@ class Section(Model):
         self.course_sections.set(course_sections)
 
     @classmethod
-    def delete_canceled_section(cls, section_code: str):
-        try:
-            section = cls.objects.get(section_code=section_code)
-        except Exception:
-            section = None
-        if section:
-            section.delete()
+    def delete_stale_sections(
+        cls,
+        terms: list[int],
+        section_codes: set[str],
+        snapshot: Optional[RowSnapshot] = None,
+        force=False,
+    ) -> int:
+        if snapshot is None:
+            snapshot = RowSnapshot.from_queryset(
+                cls.objects.filter(term__in=terms), "section_code", "fingerprint"
+            )
+        stale_section_codes = snapshot.get_deleted(section_codes)
+        if not stale_section_codes:
+            return 0
+        stale_count = len(stale_section_codes)
+        stored_count = len(snapshot)
+        if not force and stale_count > SYNC_MAX_DELETE_FRACTION * stored_count:
+            logger.error(
+                f"ABORTING deletion of {stale_count} of {stored_count} sections for"
+                f" terms {terms} (more than {SYNC_MAX_DELETE_FRACTION:.0%}). Sync"
+                " with --force to delete them."
+            )
+            return 0
+        stale_sections = cls.objects.filter(section_code__in=stale_section_codes)
+        requested_section_codes = sorted(
+            stale_sections.filter(
+                Q(requested=True) | Q(request__isnull=False)
+            ).values_list("section_code", flat=True)
+        )
+        if requested_section_codes:
+            logger.warning(
+                f"SKIPPING deletion of {len(requested_section_codes)} stale requested"
+                f" sections for terms {terms}: {requested_section_codes}"
+            )
+        deleted_section_codes = set(stale_section_codes) - set(requested_section_codes)
+        with transaction.atomic():
+            unlinked_count = (
+                cls.objects.filter(primary_section_id__in=deleted_section_codes)
+                .exclude(section_code__in=deleted_section_codes)
+                .update(primary_section=None)
+            )
+            cls.objects.filter(section_code__in=deleted_section_codes).delete()
+        if unlinked_count:
+            logger.info(
+                f"UNLINKED {unlinked_count} sections from stale primary sections for"
+                f" terms {terms}"
+            )
+        deleted_count = len(deleted_section_codes)
+        logger.info(f"DELETED {deleted_count} stale sections for terms {terms}")
+        return deleted_count
 
     @classmethod
-    def update_or_create(
-        cls,
-        query: str,
-        kwargs: Optional[dict] = None,
-        sync_related_data=True,
-    ):
-        cursor = execute_query(query, kwargs)
-        section = None
-        for (
+    def get_section_values(
+        cls, row: SectionRow, context: SyncContext, resolve_primary_section=True
+    ) -> dict:
+        (
             section_code,
             section_id,
             school_code,
@@ -593,82 +1264,476 @@ class Section(Model):
             term,
             title,
             sched_type_code,
-            section_status,
+            _,
             primary_course_id,
             primary_section_id,
             primary_subject_code,
             course_id,
             xlist_family,
-        ) in cursor:
-            if section_status != cls.ACTIVE_SECTION_STATUS_CODE:
-                cls.delete_canceled_section(section_code)
-                continue
-            school = School.get_school(school_code)
-            subject = Subject.get_subject(subject_code)
-            primary_subject = Subject.get_subject(primary_subject_code) or subject
-            schedule_type = ScheduleType.get_schedule_type(sched_type_code)
-            if primary_section_id != section_id:
-                primary_section = cls.get_section(
-                    primary_section_id, term, sync_related_data=False
+        ) = row
+        subject = context.get_subject(subject_code)
+        values = {
+            "section_code": section_code,
+            "section_id": section_id,
+            "school": context.get_school(school_code),
+            "subject": subject,
+            "course_num": course_num,
+            "section_num": section_num,
+            "term": term,
+            "title": title,
+            "schedule_type": context.get_schedule_type(sched_type_code),
+            "primary_course_id": primary_course_id or course_id,
+            "primary_subject": context.get_subject(primary_subject_code) or subject,
+            "xlist_family": xlist_family,
+        }
+        if not resolve_primary_section:
+            return values
+        if primary_section_id != section_id:
+            values["primary_section"] = cls.get_section(
+                primary_section_id, term, sync_related_data=False
+            )
+        else:
+            values["primary_section"] = None
+        return values
+
+    @staticmethod
+    def is_unchanged(
+        section, row: SectionRow, fingerprint: str, resolve_primary_section=True
+    ) -> bool:
+        if section.fingerprint != fingerprint:
+            return False
+        if not resolve_primary_section or row[11] == row[1]:
+            return True
+        return section.primary_section_id is not None
+
+    @classmethod
+    def bulk_update_or_create(
+        cls,
+        rows: list,
+        sync_related_data=True,
+        resolve_primary_sections=True,
+        context: Optional[SyncContext] = None,
+    ) -> list:
+        section_rows = dict()
+        canceled_section_codes = set()
+        for row in rows:
+            section_code = row[0]
+            if not section_code:
+                logger.error(
+                    f"FAILED to update or create section '{row[1]}': missing section"
+                    " code"
                 )
+                continue
+            if row[9] != cls.ACTIVE_SECTION_STATUS_CODE:
+                section_rows.pop(section_code, None)
+                canceled_section_codes.add(section_code)
             else:
-                primary_section = None
+                canceled_section_codes.discard(section_code)
+                section_rows[section_code] = row
+        context = context or SyncContext()
+        if canceled_section_codes:
+            _, deleted = cls.objects.filter(
+                section_code__in=canceled_section_codes
+            ).delete()
+            context.counts["deleted"] += deleted.get(cls._meta.label, 0)
+            context.canceled_section_codes.update(canceled_section_codes)
+        context.section_codes.update(section_rows)
+        if not resolve_primary_sections:
+            context.primary_section_ids.update(
+                (section_code, (row[1], row[11], row[6]))
+                for section_code, row in section_rows.items()
+            )
+        fingerprints = {
+            section_code: get_row_fingerprint(row)
+            for section_code, row in section_rows.items()
+        }
+        unchanged_sections = list()
+        if context.snapshot is not None and not resolve_primary_sections:
+            row_diff = context.snapshot.diff(
+                list(fingerprints), list(fingerprints.values())
+            )
+            unchanged_count = len(row_diff.unchanged)
+            changed_section_codes = row_diff.inserted + row_diff.changed
+            existing_sections = cls.objects.in_bulk(changed_section_codes)
+        else:
+            existing_sections = cls.objects.in_bulk(list(section_rows))
+            for section_code, row in section_rows.items():
+                section = existing_sections.get(section_code)
+                if section and cls.is_unchanged(
+                    section, row, fingerprints[section_code], resolve_primary_sections
+                ):
+                    unchanged_sections.append(section)
+            unchanged_count = len(unchanged_sections)
+            unchanged_section_codes = {section.pk for section in unchanged_sections}
+            changed_section_codes = [
+                section_code
+                for section_code in section_rows
+                if section_code not in unchanged_section_codes
+            ]
+        changed_rows = [
+            (section_rows[section_code], fingerprints[section_code])
+            for section_code in changed_section_codes
+        ]
+        context.load_section_rows(row for row, _ in changed_rows)
+        section_values = list()
+        for row, fingerprint in changed_rows:
             try:
-                section, created = cls.objects.update_or_create(
-                    section_code=section_code,
-                    defaults={
-                        "section_id": section_id,
-                        "school": school,
-                        "subject": subject,
-                        "course_num": course_num,
-                        "section_num": section_num,
-                        "term": term,
-                        "title": title,
-                        "schedule_type": schedule_type,
-                        "primary_course_id": primary_course_id or course_id,
-                        "primary_section": primary_section,
-                        "primary_subject": primary_subject,
-                        "xlist_family": xlist_family,
-                    },
-                )
-                if sync_related_data:
-                    section.sync_instructors()
-                    section.sync_also_offered_as_sections()
-                    section.sync_course_sections()
-                action = "ADDED" if created else "UPDATED"
-                logger.info(f"{action} {section}")
+                values = cls.get_section_values(row, context, resolve_primary_sections)
+                values["fingerprint"] = fingerprint
+                section_values.append(values)
             except Exception as error:
-                logger.error(
-                    f"FAILED to update or create section '{section_code}': {error}"
-                )
+                logger.error(f"FAILED to update or create section '{row[0]}': {error}")
+                context.counts["failed"] += 1
+        if resolve_primary_sections:
+            new_section_codes = [
+                values["section_code"]
+                for values in section_values
+                if values["section_code"] not in existing_sections
+            ]
+            existing_sections.update(cls.objects.in_bulk(new_section_codes))
+        now = timezone.now()
+        new_sections = list()
+        updated_sections = list()
+        for values in section_values:
+            section = existing_sections.get(values["section_code"])
+            if section:
+                for field, value in values.items():
+                    setattr(section, field, value)
+                section.updated_at = now
+                updated_sections.append(section)
+            else:
+                new_sections.append(cls(**values))
+        sections = new_sections + updated_sections
+        fields = cls.SYNC_FIELDS
+        if not resolve_primary_sections:
+            fields = [field for field in fields if field != "primary_section"]
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create(new_sections)
+                cls.objects.bulk_update(updated_sections, fields)
+        except Exception as error:
+            logger.warning(
+                f"FAILED to bulk update or create {len(sections)} sections: {error}."
+                " Saving sections individually..."
+            )
+            saved_sections = save_objects(sections, set(existing_sections), fields)
+            context.counts["failed"] += len(sections) - len(saved_sections)
+            sections = saved_sections
+            new_sections = [section for section in sections if section in new_sections]
+            updated_sections = [
+                section for section in sections if section in updated_sections
+            ]
+        context.counts["inserted"] += len(new_sections)
+        context.counts["updated"] += len(updated_sections)
+        context.counts["unchanged"] += unchanged_count
+        logger.info(
+            f"ADDED {len(new_sections)}, UPDATED {len(updated_sections)} and SKIPPED"
+            f" {unchanged_count} unchanged sections"
+        )
+        sections = sections + unchanged_sections
+        if sync_related_data:
+            for section in sections:
+                section.sync_instructors()
+                section.sync_also_offered_as_sections()
+                section.sync_course_sections()
+        return sections
+
+    @classmethod
+    def update_or_create(
+        cls,
+        query: str,
+        kwargs: Optional[dict] = None,
+        sync_related_data=True,
+        resolve_primary_sections=True,
+        context: Optional[SyncContext] = None,
+        checkpoint: Optional["SyncCheckpoint"] = None,
+    ):
+        section = None
+        for rows in stream_query(query, kwargs, row_factory=SectionRow):
+            sections = cls.bulk_update_or_create(
+                rows, sync_related_data, resolve_primary_sections, context
+            )
+            section = next(reversed(sections), section)
+            if checkpoint and context:
+                checkpoint.record(rows, context.counts)
         return section
 
+    @classmethod
+    def resolve_primary_sections(cls, primary_section_ids: dict[str, tuple]):
+        terms = {term for _, _, term in primary_section_ids.values()}
+        sections = cls.objects.filter(term__in=terms)
+        section_codes = {
+            (section_id, term): section_code
+            for section_code, section_id, term in sections.values_list(
+                "section_code", "section_id", "term"
+            )
+        }
+        missing_primary_section_ids: dict[int, set[str]] = dict()
+        for section_id, primary_section_id, term in primary_section_ids.values():
+            if (
+                primary_section_id
+                and primary_section_id != section_id
+                and (primary_section_id, term) not in section_codes
+            ):
+                missing_primary_section_ids.setdefault(term, set()).add(
+                    primary_section_id
+                )
+        for term, section_ids in missing_primary_section_ids.items():
+            logger.info(f"Fetching {len(section_ids)} primary sections for {term}...")
+            cls.sync_sections(section_ids, term, sync_related_data=False)
+            fetched_sections = cls.objects.filter(term=term, section_id__in=section_ids)
+            section_codes.update(
+                ((section_id, term), section_code)
+                for section_code, section_id in fetched_sections.values_list(
+                    "section_code", "section_id"
+                )
+            )
+        updated_sections = list()
+        for section in sections.only("section_code", "primary_section"):
+            if section.section_code not in primary_section_ids:
+                continue
+            section_id, primary_section_id, term = primary_section_ids[
+                section.section_code
+            ]
+            primary_section_code = None
+            if primary_section_id != section_id:
+                primary_section_code = section_codes.get((primary_section_id, term))
+            if section.primary_section_id != primary_section_code:
+                section.primary_section_id = primary_section_code
+                updated_sections.append(section)
+        cls.objects.bulk_update(updated_sections, ["primary_section"])
+        logger.info(f"UPDATED {len(updated_sections)} primary sections")
+
+    @classmethod
+    def get_terms(cls, terms: Optional[Union[int, list[int]]]) -> list[int]:
+        if terms:
+            return terms if isinstance(terms, list) else [terms]
+        return cls.DEFAULT_TERMS
+
     @classmethod
     def get_terms_query_and_bindings(
         cls,
         terms: Optional[Union[int, list[int]]],
         query=None,
     ) -> tuple[str, dict]:
-        if terms:
-            terms = terms if isinstance(terms, list) else [terms]
-        else:
-            terms = cls.DEFAULT_TERMS
-        placeholders = [f":{index + 1}" for index in range(len(terms))]
-        placeholders_and_values = zip(placeholders, terms)
-        kwargs = {placeholder: term for placeholder, term in placeholders_and_values}
-        placeholders_string = ",".join(f":{index + 1}" for index in range(len(terms)))
-        placeholders_string = f"({placeholders_string})"
+        terms = cls.get_terms(terms)
+        condition, kwargs = get_in_list_condition("term", terms)
         query = query or cls.QUERY
-        query = f"{query} AND term IN {placeholders_string}"
+        query = f"{query} AND {condition}"
         return query, kwargs
 
     @classmethod
-    def sync_all(cls, terms: Optional[Union[int, list[int]]] = None):
+    def get_partitions(
+        cls, terms: list[int], context: SyncContext
+    ) -> list[tuple[int, str]]:
+        query, kwargs = cls.get_terms_query_and_bindings(
+            terms, query=cls.PARTITIONS_QUERY
+        )
+        rows = list(execute_query(query, kwargs))
+        context.load_schools({row[1] for row in rows})
+        context.load_subjects({row[2] for row in rows} | {row[3] for row in rows})
+        context.load_schedule_types({row[4] for row in rows})
+        return sorted({(row[0], row[1]) for row in rows})
+
+    @classmethod
+    def sync_checkpoint(
+        cls,
+        query: str,
+        kwargs: dict,
+        checkpoint: "SyncCheckpoint",
+        context: SyncContext,
+    ):
+        context.counts.update(checkpoint.get_counts())
+        if checkpoint.completed:
+            logger.info(f"SKIPPING completed {checkpoint}")
+            return
+        if checkpoint.last_section_code:
+            logger.info(
+                f"RESUMING {checkpoint} after section"
+                f" '{checkpoint.last_section_code}'..."
+            )
+            query = f"{query} AND section_id || term > :last_section_code"
+            kwargs = kwargs | {"last_section_code": checkpoint.last_section_code}
+        cls.update_or_create(
+            f"{query} ORDER BY section_id || term",
+            kwargs,
+            sync_related_data=False,
+            resolve_primary_sections=False,
+            context=context,
+            checkpoint=checkpoint,
+        )
+        checkpoint.complete(context.counts)
+
+    @classmethod
+    def sync_partition(
+        cls, partition: tuple[int, str], run_id: int
+    ) -> tuple[dict, set, dict]:
+        term, school_code = partition
+        logger.info(f"Syncing sections for term {term} and school {school_code}...")
+        checkpoint, _ = SyncCheckpoint.objects.get_or_create(
+            run_id=run_id, term=term, school_code=school_code
+        )
+        context = SyncContext(preload=True)
+        context.snapshot = RowSnapshot.from_queryset(
+            cls.objects.filter(term=term, school_id=school_code),
+            "section_code",
+            "fingerprint",
+        )
+        try:
+            cls.sync_checkpoint(
+                f"{cls.QUERY_TERM} AND school = :school_code",
+                {"term": term, "school_code": school_code},
+                checkpoint,
+                context,
+            )
+        finally:
+            query_statistics.flush()
+        return context.counts, context.section_codes, context.primary_section_ids
+
+    @classmethod
+    def get_partition_fingerprints(cls, terms: list[int]) -> dict[tuple, tuple]:
+        query, kwargs = cls.get_terms_query_and_bindings(
+            terms, query=cls.PARTITION_FINGERPRINTS_QUERY
+        )
+        cursor = execute_query(f"{query} GROUP BY term, school", kwargs)
+        return {
+            (term, school_code): (row_count, str(row_hash))
+            for term, school_code, row_count, row_hash in cursor
+        }
+
+    @classmethod
+    def skip_unchanged_partitions(
+        cls, fingerprints: dict[tuple, tuple], context: SyncContext
+    ) -> set[tuple]:
+        unchanged_partitions = SectionPartition.get_unchanged(fingerprints)
+        for term, school_code in unchanged_partitions:
+            section_codes = cls.objects.filter(
+                term=term, school_id=school_code
+            ).values_list("section_code", flat=True)
+            context.section_codes.update(section_codes)
+            context.counts["unchanged"] += len(section_codes)
+        if unchanged_partitions:
+            logger.info(
+                f"SKIPPING {len(unchanged_partitions)} of {len(fingerprints)} unchanged"
+                " term and school partitions"
+            )
+        return unchanged_partitions
+
+    @classmethod
+    def sync_partitions(
+        cls,
+        terms: list[int],
+        context: SyncContext,
+        workers: int,
+        run: "SyncRun",
+        skipped_partitions: Optional[set[tuple]] = None,
+    ):
+        partitions = [
+            partition
+            for partition in cls.get_partitions(terms, context)
+            if partition not in (skipped_partitions or set())
+        ]
+        logger.info(
+            f"Syncing {len(partitions)} term and school partitions with {workers}"
+            " workers..."
+        )
+        sync_partition = partial(cls.sync_partition, run_id=run.pk)
+        if workers > 1:
+            query_statistics.flush()
+            connections.close_all()
+            executor = ProcessPoolExecutor(workers, mp_context=get_context("fork"))
+            results = executor.map(sync_partition, partitions)
+        else:
+            executor = None
+            results = map(sync_partition, partitions)
+        try:
+            for counts, section_codes, primary_section_ids in results:
+                for key, count in counts.items():
+                    context.counts[key] += count
+                context.section_codes.update(section_codes)
+                context.primary_section_ids.update(primary_section_ids)
+        finally:
+            if executor:
+                executor.shutdown()
+
+    @classmethod
+    def load_section_keys(cls, terms: list[int], context: SyncContext):
+        logger.info(f"Loading section keys for terms {terms}...")
+        query, kwargs = cls.get_terms_query_and_bindings(terms, query=cls.KEYS_QUERY)
+        for rows in stream_query(query, kwargs):
+            for section_code, section_id, primary_section_id, term, status in rows:
+                if section_code and status == cls.ACTIVE_SECTION_STATUS_CODE:
+                    context.section_codes.add(section_code)
+                    context.primary_section_ids[section_code] = (
+                        section_id,
+                        primary_section_id,
+                        term,
+                    )
+
+    @classmethod
+    def sync_all(
+        cls,
+        terms: Optional[Union[int, list[int]]] = None,
+        workers=1,
+        resume=False,
+        full=False,
+        force=False,
+    ):
+        terms = cls.get_terms(terms)
+        logger.info(f"Syncing sections for terms {terms}...")
+        run = SyncRun.start(terms, resume)
+        resumed = run.checkpoints.exclude(last_section_code="").exists()
+        context = SyncContext(preload=True)
+        fingerprints = cls.get_partition_fingerprints(terms)
+        skipped_partitions = set()
+        if not full:
+            skipped_partitions = cls.skip_unchanged_partitions(fingerprints, context)
+        if fingerprints and not fingerprints.keys() - skipped_partitions:
+            logger.info(f"SKIPPING section rows for terms {terms} (unchanged)")
+        elif workers > 1 or skipped_partitions:
+            cls.sync_partitions(terms, context, workers, run, skipped_partitions)
+        else:
+            context.snapshot = RowSnapshot.from_queryset(
+                cls.objects.filter(term__in=terms), "section_code", "fingerprint"
+            )
+            query, kwargs = cls.get_terms_query_and_bindings(terms)
+            checkpoint, _ = run.checkpoints.get_or_create(term=None, school_code="")
+            cls.sync_checkpoint(query, kwargs, checkpoint, context)
+        if resumed:
+            cls.load_section_keys(terms, context)
+        if context.primary_section_ids:
+            cls.resolve_primary_sections(context.primary_section_ids)
+        context.counts["deleted"] += cls.delete_stale_sections(
+            terms,
+            context.section_codes | context.canceled_section_codes,
+            context.snapshot,
+            force,
+        )
+        cls.sync_all_section_instructors(terms, force)
+        cls.sync_all_related_sections(terms)
+        counts = context.counts
         logger.info(
-            f"Syncing sections for terms {terms if terms else cls.DEFAULT_TERMS}..."
+            f"SYNCED sections for terms {terms}: {counts['inserted']} inserted,"
+            f" {counts['updated']} updated, {counts['unchanged']} unchanged,"
+            f" {counts['deleted']} deleted, {counts['failed']} failed"
+        )
+        synced_partitions = skipped_partitions | run.get_synced_partitions(
+            {
+                partition: fingerprint
+                for partition, fingerprint in fingerprints.items()
+                if partition not in skipped_partitions
+            }
         )
-        query, kwargs = cls.get_terms_query_and_bindings(terms)
-        cls.update_or_create(query, kwargs)
+        SectionPartition.record(
+            terms,
+            {
+                partition: fingerprint
+                for partition, fingerprint in fingerprints.items()
+                if partition in synced_partitions
+            },
+        )
+        run.finish()
+        return counts
 
     @classmethod
     def sync_instructor_sections(
@@ -684,11 +1749,11 @@ class Section(Model):
         query, kwargs = cls.get_terms_query_and_bindings(terms, query=query)
         kwargs = kwargs | {"penn_id": penn_id}
         cursor = execute_query(query, kwargs)
-        sections = list()
+        term_section_ids: dict[int, set[str]] = dict()
         for section_id, term in cursor:
-            sections.append((section_id, term))
-        for section, term in sections:
-            cls.sync_section(section, term=term)
+            term_section_ids.setdefault(term, set()).add(section_id)
+        for term, section_ids in term_section_ids.items():
+            cls.sync_sections(section_ids, term)
 
     @classmethod
     def sync_section(
@@ -698,6 +1763,14 @@ class Section(Model):
         kwargs = {"section_id": section_id, "term": term}
         return cls.update_or_create(cls.QUERY_SECTION_ID, kwargs, sync_related_data)
 
+    @classmethod
+    def sync_sections(cls, section_ids, term: int, sync_related_data=True):
+        queries = get_in_list_queries(
+            cls.QUERY_TERM, "section_id", sorted(section_ids), {"term": term}
+        )
+        for query, kwargs in queries:
+            cls.update_or_create(query, kwargs, sync_related_data)
+
     def sync(self):
         return self.sync_section(self.section_id)
 
@@ -845,6 +1918,12 @@ class SectionEnrollment(Enrollment):
 
 class AutoAdd(Enrollment):
     ACTIVE_STATUS = "A"
+    EMPLOYMENT_STATUS_QUERY = """
+            SELECT pennkey, employement_status
+            FROM employee_general
+            """
+    MISSING_STATUS = object()
+    employment_statuses: Optional[dict] = None
     school = ForeignKey(School, on_delete=CASCADE)
     subject = ForeignKey(Subject, on_delete=CASCADE)
     created_at = DateTimeField(auto_now_add=True)
@@ -860,28 +1939,71 @@ class AutoAdd(Enrollment):
     def __str__(self):
         return f"{self.user} as {self.role} for {self.subject} in {self.school}"
 
-    def check_employment_status(self):
-        query = """
-                SELECT employement_status
-                FROM employee_general
-                WHERE pennkey = :pennkey
-                """
-        pennkey = self.user.username
-        cursor = execute_query(query, {"pennkey": pennkey})
-        for status in cursor:
-            status = next(iter(status))
-            if status != self.ACTIVE_STATUS:
+    @classmethod
+    @contextmanager
+    def cache_employment_statuses(cls):
+        cls.employment_statuses = dict()
+        try:
+            yield
+        finally:
+            cls.employment_statuses = None
+
+    @classmethod
+    def get_employment_statuses(cls, pennkeys: set[str]) -> dict[str, Optional[str]]:
+        statuses = cls.employment_statuses
+        if statuses is None:
+            statuses = dict()
+        missing_pennkeys = sorted(pennkeys - statuses.keys())
+        queries = get_in_list_queries(
+            cls.EMPLOYMENT_STATUS_QUERY, "pennkey", missing_pennkeys, keyword="WHERE"
+        )
+        for query, kwargs in queries:
+            for pennkey, status in execute_query(query, kwargs):
+                if statuses.get(pennkey, cls.ACTIVE_STATUS) == cls.ACTIVE_STATUS:
+                    statuses[pennkey] = status
+        statuses.update(
+            (pennkey, cls.MISSING_STATUS)
+            for pennkey in missing_pennkeys
+            if pennkey not in statuses
+        )
+        return {
+            pennkey: statuses[pennkey]
+            for pennkey in pennkeys
+            if statuses[pennkey] is not cls.MISSING_STATUS
+        }
+
+    @classmethod
+    def delete_inactive(cls, auto_adds: list) -> list:
+        statuses = cls.get_employment_statuses(
+            {auto_add.user.username for auto_add in auto_adds}
+        )
+        active_auto_adds = list()
+        inactive_auto_add_ids = list()
+        for auto_add in auto_adds:
+            username = auto_add.user.username
+            if username in statuses and statuses[username] != cls.ACTIVE_STATUS:
                 logger.warning(
-                    f"User {self.user} no longer active. Removing auto-add {self}..."
+                    f"User {auto_add.user} no longer active. Removing auto-add"
+                    f" {auto_add}..."
                 )
-                self.delete()
+                inactive_auto_add_ids.append(auto_add.pk)
+            else:
+                active_auto_adds.append(auto_add)
+        if inactive_auto_add_ids:
+            cls.objects.filter(pk__in=inactive_auto_add_ids).delete()
+        return active_auto_adds
+
+    def check_employment_status(self):
+        self.delete_inactive([self])
 
     @classmethod
     def clear_inactive_employees(cls):
         logger.info("Clearing inactive employees from auto-adds...")
-        auto_adds = cls.objects.all()
-        for auto_add in auto_adds:
-            auto_add.check_employment_status()
+        auto_adds = list(cls.objects.select_related("user"))
+        active_auto_adds = cls.delete_inactive(auto_adds)
+        logger.info(
+            f"DELETED {len(auto_adds) - len(active_auto_adds)} inactive auto-adds"
+        )
 
 
 class Request(Model):
@@ -975,9 +2097,7 @@ class Request(Model):
     @staticmethod
     def get_auto_adds(school: School, subject: Subject) -> list[AutoAdd]:
         auto_adds = AutoAdd.objects.filter(school=school, subject=subject)
-        for auto_add in auto_adds:
-            auto_add.check_employment_status()
-        return list(AutoAdd.objects.filter(school=school, subject=subject))
+        return AutoAdd.delete_inactive(list(auto_adds.select_related("user")))
 
     def get_enrollments(self) -> list[SectionEnrollment]:
         section = self.section
@@ -1110,8 +2230,11 @@ class Request(Model):
     @classmethod
     def create_all_approved_sites(cls):
         approved_requests = cls.get_approved_requests()
-        for request in approved_requests:
-            request.create_canvas_site()
+        with AutoAdd.cache_employment_statuses():
+            pennkeys = AutoAdd.objects.values_list("user__username", flat=True)
+            AutoAdd.get_employment_statuses(set(pennkeys))
+            for request in approved_requests:
+                request.create_canvas_site()
 
     @staticmethod
     def get_request_section_code(request) -> str:
@@ -1132,3 +2255,214 @@ class Request(Model):
             return cls.objects.get(section=section)
         except Exception:
             return None
+
+
+class QueryStatistic(Model):
+    fingerprint = CharField(max_length=16, primary_key=True)
+    query = TextField()
+    calls = IntegerField(default=0)
+    rows = BigIntegerField(default=0)
+    total_time = FloatField(default=0)
+    max_time = FloatField(default=0)
+    slow_calls = IntegerField(default=0)
+    last_called_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-total_time"]
+
+    def __str__(self):
+        return f"{self.fingerprint} ({self.calls} calls, {self.total_time:.2f}s)"
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0
+
+    @classmethod
+    def record(
+        cls,
+        fingerprint: str,
+        query: str,
+        calls: int,
+        rows: int,
+        total_time: float,
+        max_time: float,
+        slow_calls: int,
+    ):
+        updated = cls.objects.filter(fingerprint=fingerprint).update(
+            calls=F("calls") + calls,
+            rows=F("rows") + rows,
+            total_time=F("total_time") + total_time,
+            max_time=Greatest("max_time", max_time),
+            slow_calls=F("slow_calls") + slow_calls,
+            last_called_at=Now(),
+        )
+        if updated:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    fingerprint=fingerprint,
+                    query=query,
+                    calls=calls,
+                    rows=rows,
+                    total_time=total_time,
+                    max_time=max_time,
+                    slow_calls=slow_calls,
+                )
+        except IntegrityError:
+            cls.record(
+                fingerprint, query, calls, rows, total_time, max_time, slow_calls
+            )
+
+
+class SyncRun(Model):
+    terms = CharField(max_length=255)
+    started_at = DateTimeField(auto_now_add=True)
+    finished_at = DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+
+    def __str__(self):
+        return f"sync run {self.pk} for terms {self.terms}"
+
+    @classmethod
+    def start(cls, terms: list[int], resume=False):
+        terms_value = ",".join(str(term) for term in terms)
+        if resume:
+            run = cls.objects.filter(terms=terms_value, finished_at=None).first()
+            if run:
+                logger.info(f"RESUMING {run} started at {run.started_at}...")
+                return run
+            logger.warning(
+                f"No unfinished sync run for terms {terms_value}. Starting a new run..."
+            )
+        return cls.objects.create(terms=terms_value)
+
+    def finish(self):
+        self.finished_at = timezone.now()
+        self.save(update_fields=["finished_at"])
+
+    def get_synced_partitions(self, fingerprints: dict[tuple, tuple]) -> set[tuple]:
+        checkpoints = {
+            (checkpoint.term, checkpoint.school_code): checkpoint
+            for checkpoint in self.checkpoints.filter(completed=True)
+        }
+        all_checkpoint = checkpoints.get((None, ""))
+        if all_checkpoint:
+            row_count = sum(row_count for row_count, _ in fingerprints.values())
+            synced_partitions = (
+                set(fingerprints) if all_checkpoint.is_synced(row_count) else set()
+            )
+        else:
+            synced_partitions = {
+                partition
+                for partition, (row_count, _) in fingerprints.items()
+                if partition in checkpoints
+                and checkpoints[partition].is_synced(row_count)
+            }
+        unsynced_count = len(fingerprints) - len(synced_partitions)
+        if unsynced_count:
+            logger.warning(
+                f"SKIPPING fingerprints for {unsynced_count} term and school partitions"
+                f" of {self} (rows failed to save or did not match the Data"
+                " Warehouse)"
+            )
+        return synced_partitions
+
+
+class SyncCheckpoint(Model):
+    COUNT_FIELDS = ["inserted", "updated", "unchanged", "deleted", "failed"]
+
+    run = ForeignKey(SyncRun, on_delete=CASCADE, related_name="checkpoints")
+    term = IntegerField(blank=True, null=True)
+    school_code = CharField(max_length=10, blank=True)
+    last_section_code = CharField(max_length=255, blank=True)
+    inserted = IntegerField(default=0)
+    updated = IntegerField(default=0)
+    unchanged = IntegerField(default=0)
+    deleted = IntegerField(default=0)
+    failed = IntegerField(default=0)
+    rows_read = IntegerField(default=0)
+    completed = BooleanField(default=False)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["run", "term", "school_code"], name="unique_sync_checkpoint"
+            )
+        ]
+
+    def __str__(self):
+        partition = " ".join(
+            str(value) for value in (self.term, self.school_code) if value
+        )
+        return f"{self.run} checkpoint {partition or 'all'}"
+
+    def get_counts(self) -> dict:
+        return {field: getattr(self, field) for field in self.COUNT_FIELDS}
+
+    def set_counts(self, counts: dict):
+        for field in self.COUNT_FIELDS:
+            setattr(self, field, counts.get(field, 0))
+
+    def record(self, rows: list, counts: dict):
+        self.last_section_code = next(
+            (row[0] for row in reversed(rows) if row[0]), self.last_section_code
+        )
+        self.rows_read += len(rows)
+        self.set_counts(counts)
+        self.save()
+
+    def is_synced(self, row_count: int) -> bool:
+        return not self.failed and self.rows_read == row_count
+
+    def complete(self, counts: dict):
+        self.completed = True
+        self.set_counts(counts)
+        self.save()
+
+
+class SectionPartition(Model):
+    term = IntegerField()
+    school_code = CharField(max_length=10)
+    row_count = IntegerField()
+    row_hash = CharField(max_length=40)
+    synced_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["term", "school_code"], name="unique_section_partition"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.term} {self.school_code} ({self.row_count} sections)"
+
+    @classmethod
+    def get_unchanged(cls, fingerprints: dict[tuple, tuple]) -> set[tuple]:
+        terms = {term for term, _ in fingerprints}
+        partitions = cls.objects.filter(term__in=terms)
+        return {
+            (partition.term, partition.school_code)
+            for partition in partitions
+            if fingerprints.get((partition.term, partition.school_code))
+            == (partition.row_count, partition.row_hash)
+        }
+
+    @classmethod
+    def record(cls, terms: list[int], fingerprints: dict[tuple, tuple]):
+        partitions = [
+            cls(
+                term=term,
+                school_code=school_code,
+                row_count=row_count,
+                row_hash=row_hash,
+            )
+            for (term, school_code), (row_count, row_hash) in fingerprints.items()
+        ]
+        with transaction.atomic():
+            cls.objects.filter(term__in=terms).delete()
+            cls.objects.bulk_create(partitions)
@@ -0,0 +1,433 @@
+from logging import getLogger
+from pathlib import Path
+from random import Random
+from sqlite3 import Connection, connect
+from string import ascii_uppercase
+from typing import Optional
+
+from .data_warehouse import get_in_list_condition, stream_query
+from .terms import CURRENT_TERM, NEXT_TERM
+
+logger = getLogger(__name__)
+SCHEMA = """
+         CREATE TABLE v_sched_type (
+             sched_type_code TEXT PRIMARY KEY,
+             sched_type_desc TEXT
+         );
+         CREATE TABLE v_school (
+             school_code TEXT PRIMARY KEY,
+             school_desc_long TEXT
+         );
+         CREATE TABLE v_subject (
+             subject_code TEXT PRIMARY KEY,
+             subject_desc_long TEXT,
+             school_code TEXT
+         );
+         CREATE TABLE crse_section (
+             section_id TEXT,
+             school TEXT,
+             subject TEXT,
+             course_num TEXT,
+             section_num TEXT,
+             term INTEGER,
+             title TEXT,
+             schedule_type TEXT,
+             section_status TEXT,
+             primary_course_id TEXT,
+             primary_section_id TEXT,
+             primary_subject TEXT,
+             course_id TEXT,
+             xlist_family TEXT,
+             PRIMARY KEY (section_id, term)
+         );
+         CREATE INDEX crse_section_xlist_family ON crse_section (xlist_family);
+         CREATE INDEX crse_section_course_id ON crse_section (term, course_id);
+         CREATE TABLE crse_sect_instructor (
+             section_id TEXT,
+             term INTEGER,
+             instructor_penn_id INTEGER,
+             instructor_first_name TEXT,
+             instructor_last_name TEXT,
+             instructor_email TEXT,
+             primary_instructor TEXT
+         );
+         CREATE INDEX crse_sect_instructor_section
+         ON crse_sect_instructor (section_id, term);
+         CREATE INDEX crse_sect_instructor_penn_id
+         ON crse_sect_instructor (instructor_penn_id);
+         CREATE TABLE employee_general (
+             pennkey TEXT PRIMARY KEY,
+             first_name TEXT,
+             last_name TEXT,
+             penn_id INTEGER UNIQUE,
+             email_address TEXT,
+             employement_status TEXT
+         );
+         CREATE VIEW employee_general_v AS
+         SELECT pennkey, penn_id FROM employee_general;
+         """
+SCHOOLS = [
+    ("A", "School of Arts & Sciences"),
+    ("C", "School of Social Policy & Practice"),
+    ("D", "School of Dental Medicine"),
+    ("E", "School of Engineering and Applied Science"),
+    ("F", "Stuart Weitzman School of Design"),
+    ("G", "Graduate School of Education"),
+    ("M", "Perelman School of Medicine"),
+    ("N", "School of Nursing"),
+    ("R", "Annenberg School for Communication"),
+    ("V", "School of Veterinary Medicine"),
+    ("W", "The Wharton School"),
+    ("L", "Law School"),
+    ("P", "Provost Center"),
+]
+SCHEDULE_TYPES = [
+    ("LEC", "Lecture"),
+    ("REC", "Recitation"),
+    ("LAB", "Laboratory"),
+    ("SEM", "Seminar"),
+    ("CLN", "Clinic"),
+    ("ONL", "Online Course"),
+    ("IND", "Independent Study"),
+    ("DIS", "Dissertation"),
+]
+FIRST_NAMES = [
+    "ALEX",
+    "JORDAN",
+    "TAYLOR",
+    "MORGAN",
+    "CASEY",
+    "RILEY",
+    "JAMIE",
+    "AVERY",
+    "QUINN",
+    "ROWAN",
+]
+LAST_NAMES = [
+    "SMITH",
+    "JOHNSON",
+    "WILLIAMS",
+    "BROWN",
+    "JONES",
+    "GARCIA",
+    "MILLER",
+    "DAVIS",
+    "LOPEZ",
+    "WILSON",
+]
+TITLE_WORDS = [
+    "Introduction",
+    "Advanced",
+    "Topics",
+    "Seminar",
+    "Methods",
+    "Theory",
+    "Practice",
+    "History",
+    "Analysis",
+    "Design",
+]
+TABLES = {
+    "v_sched_type": ("dwngss", ["sched_type_code", "sched_type_desc"]),
+    "v_school": ("dwngss", ["school_code", "school_desc_long"]),
+    "v_subject": ("dwngss", ["subject_code", "subject_desc_long", "school_code"]),
+    "crse_section": (
+        "dwngss_ps",
+        [
+            "section_id",
+            "school",
+            "subject",
+            "course_num",
+            "section_num",
+            "term",
+            "title",
+            "schedule_type",
+            "section_status",
+            "primary_course_id",
+            "primary_section_id",
+            "primary_subject",
+            "course_id",
+            "xlist_family",
+        ],
+    ),
+    "crse_sect_instructor": (
+        "dwngss_ps",
+        [
+            "section_id",
+            "term",
+            "instructor_penn_id",
+            "instructor_first_name",
+            "instructor_last_name",
+            "instructor_email",
+            "primary_instructor",
+        ],
+    ),
+    "employee_general": (
+        None,
+        [
+            "pennkey",
+            "first_name",
+            "last_name",
+            "penn_id",
+            "email_address",
+            "employement_status",
+        ],
+    ),
+}
+ACTIVE_STATUS = "A"
+CANCELED_STATUS = "X"
+SECTIONS_PER_SUBJECT = 60
+EMPLOYEES_PER_SECTION = 0.2
+
+
+def create_schema(connection: Connection):
+    connection.executescript(SCHEMA)
+
+
+def create_database(path: str) -> Connection:
+    database = Path(path)
+    if database.exists():
+        database.unlink()
+    connection = connect(path)
+    create_schema(connection)
+    return connection
+
+
+def get_subject_codes(random: Random, count: int) -> list[str]:
+    codes: set[str] = set()
+    while len(codes) < count:
+        length = random.choice((3, 4))
+        codes.add("".join(random.choices(ascii_uppercase, k=length)))
+    return sorted(codes)
+
+
+def get_employees(random: Random, count: int) -> list[tuple]:
+    employees = list()
+    for index in range(count):
+        pennkey = f"user{index:06d}"
+        status = ACTIVE_STATUS if random.random() < 0.95 else "T"
+        employees.append(
+            (
+                pennkey,
+                random.choice(FIRST_NAMES),
+                random.choice(LAST_NAMES),
+                10000000 + index,
+                f"{pennkey}@upenn.edu",
+                status,
+            )
+        )
+    return employees
+
+
+def get_section_row(
+    subject: str,
+    school: str,
+    course_num: str,
+    section_num: str,
+    term: int,
+    title: str,
+    schedule_type: str,
+    status: str,
+    primary: Optional[tuple[str, str, str]] = None,
+    xlist_family: Optional[str] = None,
+) -> tuple:
+    course_id = f"{subject}{course_num}"
+    section_id = f"{course_id}{section_num}"
+    primary_subject, primary_course_id, primary_section_id = primary or (
+        subject,
+        course_id,
+        section_id,
+    )
+    return (
+        section_id,
+        school,
+        subject,
+        course_num,
+        section_num,
+        term,
+        title,
+        schedule_type,
+        status,
+        primary_course_id if xlist_family else None,
+        primary_section_id,
+        primary_subject,
+        course_id,
+        xlist_family,
+    )
+
+
+def get_sections(
+    random: Random,
+    count: int,
+    subjects: list[tuple[str, str, str]],
+    terms: list[int],
+) -> list[tuple]:
+    sections: list[tuple] = list()
+    course_numbers: set[tuple[str, int, str]] = set()
+    xlist_count = 0
+    while len(sections) < count:
+        subject, _, school = random.choice(subjects)
+        term = random.choice(terms)
+        course_num = f"{random.randint(100, 9999):04d}"
+        if (subject, term, course_num) in course_numbers:
+            continue
+        course_numbers.add((subject, term, course_num))
+        title = " ".join(random.sample(TITLE_WORDS, k=3))
+        xlisted_subjects = list()
+        xlist_family = None
+        if random.random() < 0.1:
+            xlist_count += 1
+            xlist_family = f"{term}{random.choice(ascii_uppercase)}{xlist_count:04d}"
+            others = [
+                other
+                for other in subjects
+                if other[0] != subject
+                and (other[0], term, course_num) not in course_numbers
+            ]
+            xlisted_subjects = random.sample(others, k=random.randint(1, 2))
+            for xlisted_subject, _, _ in xlisted_subjects:
+                course_numbers.add((xlisted_subject, term, course_num))
+        schedule_types = ["LEC"] + ["REC"] * random.randint(0, 4)
+        if random.random() < 0.05:
+            schedule_types = [random.choice(SCHEDULE_TYPES)[0]]
+        for index, schedule_type in enumerate(schedule_types):
+            section_num = "001" if index == 0 else f"{200 + index:03d}"
+            status = ACTIVE_STATUS if random.random() < 0.97 else CANCELED_STATUS
+            primary_row = get_section_row(
+                subject,
+                school,
+                course_num,
+                section_num,
+                term,
+                title,
+                schedule_type,
+                status,
+                xlist_family=xlist_family,
+            )
+            sections.append(primary_row)
+            primary = (subject, primary_row[12], primary_row[0])
+            for xlisted_subject, _, xlisted_school in xlisted_subjects:
+                sections.append(
+                    get_section_row(
+                        xlisted_subject,
+                        xlisted_school,
+                        course_num,
+                        section_num,
+                        term,
+                        title,
+                        schedule_type,
+                        status,
+                        primary=primary,
+                        xlist_family=xlist_family,
+                    )
+                )
+    return sections[:count]
+
+
+def get_instructors(
+    random: Random, sections: list[tuple], employees: list[tuple]
+) -> list[tuple]:
+    instructors = list()
+    for section in sections:
+        section_id = section[0]
+        term = section[5]
+        if random.random() < 0.9:
+            assigned = random.sample(employees, k=random.choice((1, 1, 1, 2)))
+            for index, employee in enumerate(assigned):
+                _, first_name, last_name, penn_id, email, _ = employee
+                primary_instructor = "Y" if index == 0 else "N"
+                instructors.append(
+                    (
+                        section_id,
+                        term,
+                        penn_id,
+                        first_name,
+                        last_name,
+                        email,
+                        primary_instructor,
+                    )
+                )
+    return instructors
+
+
+def generate_data_warehouse(
+    path: str,
+    section_count: int,
+    terms: Optional[list[int]] = None,
+    seed: int = 0,
+):
+    terms = terms or [CURRENT_TERM, NEXT_TERM]
+    random = Random(seed)
+    logger.info(f"Generating {section_count} sections in '{path}'...")
+    connection = create_database(path)
+    subject_count = max(10, section_count // SECTIONS_PER_SUBJECT)
+    subjects = [
+        (code, f"{code.title()} Studies", random.choice(SCHOOLS)[0])
+        for code in get_subject_codes(random, subject_count)
+    ]
+    employee_count = max(50, int(section_count * EMPLOYEES_PER_SECTION))
+    employees = get_employees(random, employee_count)
+    sections = get_sections(random, section_count, subjects, terms)
+    instructors = get_instructors(random, sections, employees)
+    with connection:
+        connection.executemany("INSERT INTO v_sched_type VALUES (?, ?)", SCHEDULE_TYPES)
+        connection.executemany("INSERT INTO v_school VALUES (?, ?)", SCHOOLS)
+        connection.executemany("INSERT INTO v_subject VALUES (?, ?, ?)", subjects)
+        connection.executemany(
+            "INSERT INTO employee_general VALUES (?, ?, ?, ?, ?, ?)", employees
+        )
+        connection.executemany(
+            f"INSERT INTO crse_section VALUES ({', '.join('?' * 14)})", sections
+        )
+        connection.executemany(
+            "INSERT INTO crse_sect_instructor VALUES (?, ?, ?, ?, ?, ?, ?)",
+            instructors,
+        )
+    connection.close()
+    logger.info(
+        f"GENERATED {len(sections)} sections, {len(instructors)} instructors and"
+        f" {len(employees)} employees in '{path}'"
+    )
+
+
+def get_extract_query(table: str, terms: list[int]) -> tuple[str, dict]:
+    schema, columns = TABLES[table]
+    table_name = f"{schema}.{table}" if schema else table
+    query = f"SELECT {', '.join(columns)} FROM {table_name}"
+    if "term" in columns:
+        condition, kwargs = get_in_list_condition("term", terms)
+        return f"{query} WHERE {condition}", kwargs
+    if table == "employee_general":
+        condition, kwargs = get_in_list_condition("term", terms)
+        query = f"""
+                {query}
+                WHERE penn_id IN (
+                    SELECT instructor_penn_id
+                    FROM dwngss_ps.crse_sect_instructor
+                    WHERE {condition}
+                )
+                """
+        return query, kwargs
+    return query, {}
+
+
+def extract_data_warehouse(path: str, terms: Optional[list[int]] = None) -> dict:
+    terms = terms or [CURRENT_TERM, NEXT_TERM]
+    logger.info(f"Extracting Data Warehouse tables for terms {terms} to '{path}'...")
+    connection = create_database(path)
+    row_counts = dict()
+    for table, (_, columns) in TABLES.items():
+        query, kwargs = get_extract_query(table, terms)
+        insert = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+        row_count = 0
+        with connection:
+            for rows in stream_query(query, kwargs):
+                connection.executemany(insert, rows)
+                row_count += len(rows)
+        row_counts[table] = row_count
+        if row_count:
+            logger.info(f"EXTRACTED {row_count} rows from '{table}'")
+        else:
+            logger.warning(f"NO rows extracted from '{table}'")
+    connection.close()
+    return row_counts
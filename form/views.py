@@ -463,8 +463,11 @@ class RequestFormView(FormView):
         additional_enrollments = [
             enrollment for enrollment in additional_enrollments if enrollment
         ]
+        users = User.get_users(
+            enrollment["user"] for enrollment in additional_enrollments
+        )
         for index, enrollment in enumerate(additional_enrollments):
-            user = User.get_user(enrollment["user"])
+            user = users.get(enrollment["user"])
             role = SectionEnrollment.CanvasRole.get_value(enrollment["role"])
             additional_enrollments[index] = SectionEnrollment.objects.create(
                 user=user, role=role, request=request
@@ -0,0 +1,235 @@
+from sqlite3 import OperationalError
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+
+from form.data_warehouse import (
+    CircuitBreaker,
+    DataWarehouseError,
+    DataWarehouseUnavailableError,
+    QueryCache,
+    QueryStatistics,
+    execute_query,
+    get_in_list_queries,
+    normalize_query,
+    stream_query,
+)
+from form.models import QueryStatistic
+
+BACKEND = "form.data_warehouse.backend"
+CIRCUIT_BREAKER = "form.data_warehouse.circuit_breaker"
+MONOTONIC = "form.data_warehouse.monotonic"
+RETRIES = "form.data_warehouse.DATA_WAREHOUSE_RETRIES"
+SLEEP = "form.data_warehouse.sleep"
+QUERY = """
+        SELECT school_code, school_desc_long
+        FROM dwngss.v_school
+        WHERE school_code = :school_code
+        """
+ROWS = (("A", "School of Arts & Sciences"),)
+
+
+class QueryCacheTest(TestCase):
+    def setUp(self):
+        self.cache = QueryCache(ttl=10, negative_ttl=5, max_entries=2)
+
+    def test_get_key(self):
+        key = self.cache.get_key(QUERY, {"school_code": "A"})
+        same_key = self.cache.get_key(" ".join(QUERY.split()), {"school_code": "A"})
+        other_key = self.cache.get_key(QUERY, {"school_code": "B"})
+        self.assertEqual(key, same_key)
+        self.assertNotEqual(key, other_key)
+
+    @patch(MONOTONIC)
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        key = self.cache.get_key(QUERY, {"school_code": "A"})
+        negative_key = self.cache.get_key(QUERY, {"school_code": "Z"})
+        self.cache.set(key, ROWS)
+        self.cache.set(negative_key, ())
+        self.assertEqual(self.cache.get(key), ROWS)
+        self.assertEqual(self.cache.get(negative_key), ())
+        mock_monotonic.return_value = 6
+        self.assertEqual(self.cache.get(key), ROWS)
+        self.assertIsNone(self.cache.get(negative_key))
+        mock_monotonic.return_value = 11
+        self.assertIsNone(self.cache.get(key))
+
+    def test_max_entries(self):
+        keys = [self.cache.get_key(QUERY, {"school_code": code}) for code in "ABC"]
+        self.cache.set(keys[0], ROWS)
+        self.cache.set(keys[1], ROWS)
+        self.cache.get(keys[0])
+        self.cache.set(keys[2], ROWS)
+        self.assertEqual(self.cache.get(keys[0]), ROWS)
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[2]), ROWS)
+
+
+class QueryStatisticsTest(TestCase):
+    def test_normalize_query(self):
+        query = """
+                SELECT section_id
+                FROM dwngss_ps.crse_section
+                WHERE school NOT IN ('W', 'L')
+                AND term IN (:1,:2, :3)
+                AND course_num > 1000
+                """
+        self.assertEqual(
+            normalize_query(query),
+            "SELECT section_id FROM dwngss_ps.crse_section WHERE school NOT IN (?, ?)"
+            " AND term IN (:list) AND course_num > ?",
+        )
+
+    def test_record(self):
+        statistics = QueryStatistics(slow_query_threshold=1, flush_interval=60)
+        with self.assertLogs("form.data_warehouse", level="WARNING") as logs:
+            statistics.record(QUERY, 0.5, 1)
+            statistics.record(QUERY, 2, 3)
+        self.assertEqual(len(logs.output), 1)
+        self.assertFalse(QueryStatistic.objects.exists())
+        statistics.flush()
+        statistic = QueryStatistic.objects.get()
+        self.assertEqual(statistic.calls, 2)
+        self.assertEqual(statistic.rows, 4)
+        self.assertEqual(statistic.total_time, 2.5)
+        self.assertEqual(statistic.max_time, 2)
+        self.assertEqual(statistic.slow_calls, 1)
+        statistics.record(QUERY, 0.1, 0)
+        statistics.flush()
+        statistic = QueryStatistic.objects.get()
+        self.assertEqual(statistic.calls, 3)
+        self.assertEqual(statistic.max_time, 2)
+
+
+class CircuitBreakerTest(TestCase):
+    @patch(MONOTONIC)
+    def test_circuit_breaker(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        circuit_breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        circuit_breaker.record_failure()
+        self.assertFalse(circuit_breaker.is_open())
+        circuit_breaker.record_failure()
+        self.assertTrue(circuit_breaker.is_open())
+        mock_monotonic.return_value = 31
+        self.assertFalse(circuit_breaker.is_open())
+        circuit_breaker.record_failure()
+        self.assertTrue(circuit_breaker.is_open())
+        mock_monotonic.return_value = 62
+        circuit_breaker.record_success()
+        self.assertFalse(circuit_breaker.is_open())
+        circuit_breaker.record_failure()
+        self.assertFalse(circuit_breaker.is_open())
+
+
+class InListQueryTest(TestCase):
+    def test_get_in_list_queries(self):
+        values = ["A", "B", "C", "A", "D", "E", "F", "G"]
+        queries = list(
+            get_in_list_queries(
+                "SELECT * FROM t WHERE term = :term",
+                "t.code",
+                values,
+                {"term": 2022},
+                chunk_size=4,
+            )
+        )
+        self.assertEqual(len(queries), 2)
+        first_query, first_kwargs = queries[0]
+        self.assertEqual(
+            first_query,
+            "SELECT * FROM t WHERE term = :term AND t.code IN (:code_0, :code_1,"
+            " :code_2, :code_3)",
+        )
+        self.assertEqual(
+            first_kwargs,
+            {"term": 2022, "code_0": "A", "code_1": "B", "code_2": "C", "code_3": "D"},
+        )
+        second_query, second_kwargs = queries[1]
+        self.assertIn("t.code IN (:code_0, :code_1, :code_2, :code_3)", second_query)
+        self.assertEqual(
+            [second_kwargs[f"code_{index}"] for index in range(4)],
+            ["E", "F", "G", "G"],
+        )
+
+
+@patch(SLEEP)
+@patch(RETRIES, 3)
+@patch(CIRCUIT_BREAKER, CircuitBreaker(failure_threshold=10, cooldown=30))
+class RetryTest(TestCase):
+    def get_backend(self, *errors):
+        backend = MagicMock()
+        backend.execute.side_effect = [*errors, None]
+        backend.is_retryable.side_effect = lambda error: isinstance(
+            error, OperationalError
+        )
+        cursor = backend.get_connection.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = [list(ROWS), []]
+        return backend
+
+    def test_retry_transient_error(self, mock_sleep):
+        backend = self.get_backend(OperationalError("database is locked"))
+        with patch(BACKEND, backend):
+            rows = tuple(execute_query(QUERY))
+        self.assertEqual(rows, ROWS)
+        self.assertEqual(backend.execute.call_count, 2)
+        backend.drop_connection.assert_called_once()
+        mock_sleep.assert_called_once()
+
+    def test_retries_exhausted(self, mock_sleep):
+        backend = self.get_backend(*[OperationalError("database is locked")] * 4)
+        with patch(BACKEND, backend), self.assertRaises(DataWarehouseError):
+            execute_query(QUERY)
+        self.assertEqual(backend.execute.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+
+    def test_non_retryable_error(self, mock_sleep):
+        backend = self.get_backend(ValueError("ORA-00942: table does not exist"))
+        with patch(BACKEND, backend), self.assertRaises(DataWarehouseError):
+            execute_query(QUERY)
+        backend.release_connection.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_failures_counted_once_per_query(self, mock_sleep):
+        circuit_breaker = CircuitBreaker(failure_threshold=10, cooldown=30)
+        with patch(CIRCUIT_BREAKER, circuit_breaker):
+            backend = self.get_backend(OperationalError("database is locked"))
+            with patch(BACKEND, backend):
+                tuple(execute_query(QUERY))
+            self.assertEqual(circuit_breaker.failures, 0)
+            backend = self.get_backend(*[OperationalError("database is locked")] * 4)
+            with patch(BACKEND, backend), self.assertRaises(DataWarehouseError):
+                execute_query(QUERY)
+            self.assertEqual(circuit_breaker.failures, 1)
+            backend = self.get_backend(ValueError("ORA-00942: table does not exist"))
+            with patch(BACKEND, backend), self.assertRaises(DataWarehouseError):
+                execute_query(QUERY)
+            self.assertEqual(circuit_breaker.failures, 1)
+            backend = self.get_backend()
+            backend.get_connection.side_effect = ValueError("ORA-01017: invalid")
+            with patch(BACKEND, backend), self.assertRaises(DataWarehouseError):
+                execute_query(QUERY)
+            self.assertEqual(circuit_breaker.failures, 2)
+
+    def test_circuit_breaker_open(self, mock_sleep):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=30)
+        circuit_breaker.record_failure()
+        backend = self.get_backend()
+        with patch(CIRCUIT_BREAKER, circuit_breaker), patch(BACKEND, backend):
+            with self.assertRaises(DataWarehouseUnavailableError):
+                execute_query(QUERY)
+            with self.assertRaises(DataWarehouseUnavailableError):
+                list(stream_query(QUERY))
+        backend.get_connection.assert_not_called()
+
+    def test_retryable_fetch_error(self, mock_sleep):
+        circuit_breaker = CircuitBreaker(failure_threshold=10, cooldown=30)
+        backend = self.get_backend()
+        cursor = backend.get_connection.return_value.cursor.return_value
+        cursor.fetchmany.side_effect = OperationalError("database is locked")
+        with patch(CIRCUIT_BREAKER, circuit_breaker), patch(BACKEND, backend):
+            with self.assertRaises(DataWarehouseError):
+                list(stream_query(QUERY))
+        backend.drop_connection.assert_called_once()
+        backend.release_connection.assert_not_called()
+        self.assertEqual(circuit_breaker.failures, 1)
@@ -0,0 +1,30 @@
+from unittest import skipIf
+
+from django.test import TestCase
+
+from form.diff import RowDiff, RowSnapshot, numpy
+
+STORED_KEYS = ["B", "A", "C"]
+STORED_HASHES = ["b", "a", "c"]
+KEYS = ["A", "C", "D", "E"]
+HASHES = ["a", "changed", "d", "e"]
+
+
+class RowSnapshotTest(TestCase):
+    def assert_diff(self, columnar: bool):
+        snapshot = RowSnapshot(STORED_KEYS, STORED_HASHES, columnar)
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(snapshot.diff(KEYS, HASHES), RowDiff(["D", "E"], ["C"], ["A"]))
+        self.assertEqual(snapshot.diff([], []), RowDiff([], [], []))
+        self.assertEqual(snapshot.get_deleted(set(KEYS)), ["B"])
+
+    def test_diff_rows(self):
+        self.assert_diff(columnar=False)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_diff_columns(self):
+        self.assert_diff(columnar=True)
+
+    def test_empty_snapshot(self):
+        snapshot = RowSnapshot([], [])
+        self.assertEqual(snapshot.diff(KEYS, HASHES), RowDiff(KEYS, [], []))
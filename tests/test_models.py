@@ -2,17 +2,22 @@ from unittest.mock import patch
 
 from django.test import TestCase
 
+from form.data_warehouse import DataWarehouseUnavailableError
 from form.models import (
+    AutoAdd,
     Enrollment,
     Request,
     ScheduleType,
     School,
     Section,
     SectionEnrollment,
+    SectionPartition,
     Subject,
+    SyncContext,
+    SyncRun,
     User,
 )
-from form.terms import CURRENT_TERM, TWO_TERMS_AHEAD
+from form.terms import CURRENT_TERM, NEXT_TERM, TWO_TERMS_AHEAD
 from tests.mocks import (
     CANVAS_ID,
     MockAccount,
@@ -23,6 +28,8 @@ from tests.mocks import (
 )
 
 EXECUTE_QUERY = "form.models.execute_query"
+STREAM_QUERY = "form.models.stream_query"
+SYNC_MAX_DELETE_FRACTION = "form.models.SYNC_MAX_DELETE_FRACTION"
 GET_CANVAS_USER_ID_BY_PENNKEY = "form.models.get_canvas_user_id_by_pennkey"
 GET_ALL_CANVAS_ACCOUNTS = "form.models.get_all_canvas_accounts"
 GET_CANVAS_ENROLLMENT_TERM_ID = "form.models.get_canvas_enrollment_term_id"
@@ -192,6 +199,60 @@ class UserTest(TestCase):
         self.assertIsNone(user.penn_id)
         self.assertFalse(user.email)
 
+    @patch(EXECUTE_QUERY)
+    def test_sync_users(self, mock_execute_query):
+        existing_user = create_user()
+        mock_execute_query.reset_mock()
+        mock_execute_query.return_value = (
+            (PENNKEY, "NEW", LAST_NAME.upper(), PENN_ID, f"{EMAIL}    "),
+            ("other", "OTHER", LAST_NAME.upper(), self.new_penn_id, None),
+        )
+        users = User.sync_users([PENNKEY, "other", "missing"])
+        mock_execute_query.assert_called_once()
+        self.assertEqual(users[PENNKEY].pk, existing_user.pk)
+        self.assertEqual(users[PENNKEY].first_name, "New")
+        self.assertEqual(users[PENNKEY].email, EMAIL)
+        self.assertEqual(User.objects.get(username="other").penn_id, self.new_penn_id)
+        self.assertNotIn("missing", users)
+        mock_execute_query.reset_mock()
+        users = User.get_users([PENNKEY, "other"])
+        mock_execute_query.assert_not_called()
+        self.assertEqual(set(users), {PENNKEY, "other"})
+
+    @patch(EXECUTE_QUERY)
+    def test_get_user_data_warehouse_unavailable(self, mock_execute_query):
+        mock_execute_query.side_effect = DataWarehouseUnavailableError()
+        self.assertIsNone(User.get_user("missing"))
+        self.assertEqual(User.get_users(["missing"]), {})
+        self.assertIsNone(School.get_school("MISS"))
+        self.assertFalse(User.objects.filter(username="missing").exists())
+
+    @patch(EXECUTE_QUERY)
+    @patch("form.models.is_data_warehouse_available")
+    def test_get_sections_data_warehouse_unavailable(
+        self, mock_is_data_warehouse_available, mock_execute_query
+    ):
+        mock_execute_query.return_value = self.get_mock_user()
+        user = create_user()
+        section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM,
+            SECTION_NUM,
+            TERM,
+            TITLE,
+        )
+        section.instructors.add(user)
+        mock_execute_query.reset_mock()
+        mock_is_data_warehouse_available.return_value = False
+        sections = user.get_sections()
+        mock_execute_query.assert_not_called()
+        self.assertEqual(sections, [section])
+
     @patch(EXECUTE_QUERY)
     @patch(GET_CANVAS_USER_ID_BY_PENNKEY)
     @patch("form.models.get_canvas_main_account")
@@ -271,6 +332,20 @@ class SchoolTest(TestCase):
         self.assertTrue(len(subjects), 1)
         self.assertEqual(subject.subject_code, SUBJECT_CODE)
 
+    def test_toggle_visible(self):
+        Subject.objects.create(
+            subject_code=SUBJECT_CODE,
+            subject_desc_long=SUBJECT_DESC_LONG,
+            school=self.school,
+        )
+        school = School.objects.get(school_code=SCHOOL_CODE)
+        with self.assertNumQueries(1):
+            school.save()
+        school.toggle_visible()
+        self.assertFalse(Subject.objects.get(subject_code=SUBJECT_CODE).visible)
+        school.toggle_visible()
+        self.assertTrue(Subject.objects.get(subject_code=SUBJECT_CODE).visible)
+
     def test_get_canvas_school_name(self):
         veterinary_medicine_code = "V"
         veterinary_medicine_name = "Veterinary Medicine"
@@ -321,6 +396,9 @@ class SchoolTest(TestCase):
         expected_school_count = success_school_count + school_count
         school_count = School.objects.count()
         self.assertEqual(school_count, expected_school_count)
+        mock_get_all_canvas_accounts.assert_called_once()
+        self.assertEqual(School.objects.get(pk="ABCD").canvas_sub_account_id, 1)
+        self.assertIsNone(School.objects.get(pk="EFGH").canvas_sub_account_id)
 
 
 class SubjectTest(TestCase):
@@ -361,6 +439,38 @@ class SubjectTest(TestCase):
         self.assertEqual(subject_count, expected_subject_count)
 
 
+class SyncContextTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        school = School.objects.create(
+            school_code=SCHOOL_CODE, school_desc_long=SCHOOL_DESC_LONG
+        )
+        Subject.objects.create(
+            subject_code=SUBJECT_CODE,
+            subject_desc_long=SUBJECT_DESC_LONG,
+            school=school,
+        )
+
+    @patch(EXECUTE_QUERY)
+    def test_load_subjects(self, mock_execute_query):
+        new_subject_code = "NEW"
+        missing_subject_code = "MISS"
+        mock_execute_query.return_value = (
+            (new_subject_code, f"New {SUBJECT_DESC_LONG}", SCHOOL_CODE),
+        )
+        context = SyncContext(preload=True)
+        subject_codes = {SUBJECT_CODE, new_subject_code, missing_subject_code}
+        context.load_subjects(subject_codes)
+        self.assertEqual(mock_execute_query.call_count, 1)
+        new_subject = context.get_subject(new_subject_code)
+        self.assertEqual(new_subject.school.school_code, SCHOOL_CODE)
+        self.assertEqual(context.get_subject(SUBJECT_CODE).subject_code, SUBJECT_CODE)
+        self.assertIsNone(context.get_subject(missing_subject_code))
+        with self.assertNumQueries(0):
+            context.load_subjects(subject_codes)
+        self.assertEqual(mock_execute_query.call_count, 1)
+
+
 class SectionTest(TestCase):
     mock_instructors_response = (INSTRUCTORS[0],)
     mock_empty_response = ()
@@ -491,8 +601,9 @@ class SectionTest(TestCase):
         self.assertTrue(TWO_TERMS_AHEAD in terms)
         self.assertFalse(CURRENT_TERM in terms)
 
+    @patch(STREAM_QUERY)
     @patch(EXECUTE_QUERY)
-    def test_sync_all(self, mock_execute_query):
+    def test_sync_all(self, mock_execute_query, mock_stream_query):
         Subject.objects.create(
             subject_code=PRIMARY_SUBJECT_CODE,
             subject_desc_long=PRIMARY_SUBJECT_DESC_LONG,
@@ -508,28 +619,9 @@ class SectionTest(TestCase):
         )
         mock_bad_value_section = self.get_mock_section_data(bad_value=True)
         new_schedule_type = (("NEW", f"New {SCHED_TYPE_DESC}"),)
-        mock_primary_query_responses = [
-            self.mock_instructors_response,
-            self.mock_empty_response,
-            self.mock_empty_response,
+        mock_section_instructors = [
+            [(mock_secondary_section[0], *instructor) for instructor in INSTRUCTORS]
         ]
-        mock_secondary_query_responses = [
-            (mock_primary_section,),
-            self.mock_instructors_response,
-            self.mock_empty_response,
-            self.mock_empty_response,
-        ]
-        mock_new_schedule_type_responses = [
-            new_schedule_type,
-            self.mock_instructors_response,
-            self.mock_empty_response,
-            self.mock_empty_response,
-        ]
-        mock_query_responses = (
-            mock_primary_query_responses
-            + mock_secondary_query_responses
-            + mock_new_schedule_type_responses
-        )
         mock_sections = [
             (
                 mock_primary_section,
@@ -540,16 +632,344 @@ class SectionTest(TestCase):
                 mock_bad_value_section,
             )
         ]
-        side_effect = mock_sections + mock_query_responses
-        mock_execute_query.side_effect = side_effect
+        mock_stream_query.side_effect = [mock_sections, mock_section_instructors]
+        mock_execute_query.side_effect = [(), new_schedule_type]
         Section.sync_all()
+        primary_section = Section.objects.get(section_code=mock_primary_section[0])
+        secondary_section = Section.objects.get(section_code=mock_secondary_section[0])
+        self.assertEqual(primary_section.schedule_type.sched_type_code, "NEW")
+        self.assertEqual(secondary_section.primary_section, primary_section)
+        self.assertTrue(secondary_section.instructors.exists())
+        self.assertEqual(
+            set(secondary_section.also_offered_as.all()),
+            {primary_section, secondary_section},
+        )
+        self.assertIn(secondary_section, primary_section.also_offered_as.all())
+        self.assertFalse(
+            Section.objects.filter(
+                section_code=mock_unsynced_canceled_section[0]
+            ).exists()
+        )
+        self.assertEqual(Section.objects.count(), 2)
 
+    @patch(STREAM_QUERY)
     @patch(EXECUTE_QUERY)
-    def test_sync(self, mock_execute_query):
+    def test_sync_all_resume(self, mock_execute_query, mock_stream_query):
+        mock_execute_query.return_value = ()
+        Subject.objects.create(
+            subject_code=PRIMARY_SUBJECT_CODE,
+            subject_desc_long=PRIMARY_SUBJECT_DESC_LONG,
+        )
+        mock_primary_section = self.get_mock_section_data()
+        mock_secondary_section = self.get_mock_section_data(primary=False)
+        run = SyncRun.start(Section.DEFAULT_TERMS)
+        run.checkpoints.create(last_section_code=mock_secondary_section[0], updated=1)
+        mock_section_keys = [
+            (row[0], row[1], row[11], row[6], row[9])
+            for row in (mock_primary_section, mock_secondary_section)
+        ]
+        mock_stream_query.side_effect = [
+            [(mock_primary_section,)],
+            [mock_section_keys],
+            [],
+        ]
+        counts = Section.sync_all(resume=True)
+        query, kwargs = mock_stream_query.call_args_list[0].args
+        self.assertIn("> :last_section_code", query)
+        self.assertEqual(kwargs["last_section_code"], mock_secondary_section[0])
+        self.assertEqual(counts["inserted"], 1)
+        self.assertEqual(counts["updated"], 1)
+        section = Section.objects.get(section_code=mock_secondary_section[0])
+        self.assertEqual(section.primary_section.section_code, mock_primary_section[0])
+        run.refresh_from_db()
+        self.assertIsNotNone(run.finished_at)
+
+    @patch(STREAM_QUERY)
+    @patch(EXECUTE_QUERY)
+    def test_sync_all_unchanged_partitions(self, mock_execute_query, mock_stream_query):
+        terms = Section.DEFAULT_TERMS
+        fingerprint = (TERM, SCHOOL_CODE, 1, 1234)
+        mock_execute_query.return_value = (fingerprint,)
+        mock_stream_query.return_value = []
+        SectionPartition.record(terms, {(TERM, SCHOOL_CODE): (1, "1234")})
+        counts = Section.sync_all()
+        mock_stream_query.assert_called_once()
+        self.assertEqual(counts["unchanged"], 1)
+        self.assertEqual(counts["deleted"], 0)
+        self.assertTrue(Section.objects.filter(pk=self.section.pk).exists())
+        self.assertEqual(
+            SectionPartition.objects.get(term=TERM, school_code=SCHOOL_CODE).row_hash,
+            "1234",
+        )
+
+    @patch(STREAM_QUERY)
+    @patch(EXECUTE_QUERY)
+    def test_sync_all_canceled_section(self, mock_execute_query, mock_stream_query):
+        mock_execute_query.return_value = ()
+        mock_canceled_section = self.get_mock_section_data(primary=False, canceled=True)
+        mock_stream_query.side_effect = [[(mock_canceled_section,)], []]
+        with patch(SYNC_MAX_DELETE_FRACTION, 1):
+            counts = Section.sync_all()
+        self.assertEqual(counts["deleted"], 1)
+        self.assertFalse(Section.objects.filter(pk=self.section.pk).exists())
+
+    def test_get_synced_partitions(self):
+        fingerprints = {
+            (TERM, "A"): (2, "1"),
+            (TERM, "B"): (3, "2"),
+            (TERM, "C"): (1, "3"),
+            (TERM, "D"): (1, "4"),
+        }
+        run = SyncRun.start(Section.DEFAULT_TERMS)
+        run.checkpoints.create(term=TERM, school_code="A", rows_read=2, completed=True)
+        run.checkpoints.create(term=TERM, school_code="B", rows_read=1, completed=True)
+        run.checkpoints.create(term=TERM, school_code="C", rows_read=1)
+        run.checkpoints.create(
+            term=TERM, school_code="D", rows_read=1, failed=1, completed=True
+        )
+        self.assertEqual(run.get_synced_partitions(fingerprints), {(TERM, "A")})
+        run = SyncRun.start(Section.DEFAULT_TERMS)
+        checkpoint = run.checkpoints.create(rows_read=5, completed=True)
+        self.assertEqual(run.get_synced_partitions(fingerprints), set())
+        checkpoint.rows_read = 7
+        checkpoint.failed = 1
+        checkpoint.save()
+        self.assertEqual(run.get_synced_partitions(fingerprints), set())
+        checkpoint.failed = 0
+        checkpoint.save()
+        self.assertEqual(run.get_synced_partitions(fingerprints), set(fingerprints))
+
+    @patch(STREAM_QUERY)
+    def test_resolve_primary_sections(self, mock_stream_query):
+        Subject.objects.create(
+            subject_code=PRIMARY_SUBJECT_CODE,
+            subject_desc_long=PRIMARY_SUBJECT_DESC_LONG,
+        )
+        mock_secondary_section = self.get_mock_section_data(primary=False)
+        mock_primary_section = self.get_mock_section_data()
+        mock_stream_query.side_effect = [
+            [(mock_secondary_section,)],
+            [(mock_primary_section,)],
+        ]
+        query, kwargs = Section.get_terms_query_and_bindings(TERM)
+        context = SyncContext()
+        Section.update_or_create(
+            query,
+            kwargs,
+            sync_related_data=False,
+            resolve_primary_sections=False,
+            context=context,
+        )
+        Section.resolve_primary_sections(context.primary_section_ids)
+        self.assertEqual(mock_stream_query.call_count, 2)
+        section = Section.objects.get(section_code=self.section.section_code)
+        self.assertEqual(section.primary_section.section_code, mock_primary_section[0])
+        self.assertIsNone(section.primary_section.primary_section)
+
+    @patch(EXECUTE_QUERY)
+    def test_get_partitions(self, mock_execute_query):
+        mock_execute_query.return_value = (
+            (TERM, SCHOOL_CODE, SUBJECT_CODE, SUBJECT_CODE, SCHED_TYPE_CODE),
+            (NEXT_TERM, SCHOOL_CODE, SUBJECT_CODE, SUBJECT_CODE, SCHED_TYPE_CODE),
+            (TERM, SCHOOL_CODE, SUBJECT_CODE, SUBJECT_CODE, SCHED_TYPE_CODE),
+        )
+        context = SyncContext()
+        partitions = Section.get_partitions([TERM, NEXT_TERM], context)
+        self.assertEqual(partitions, [(TERM, SCHOOL_CODE), (NEXT_TERM, SCHOOL_CODE)])
+        self.assertEqual(mock_execute_query.call_count, 1)
+        self.assertEqual(context.get_subject(SUBJECT_CODE), self.section.subject)
+
+    @patch(STREAM_QUERY)
+    def test_sync_partition(self, mock_stream_query):
+        Subject.objects.create(
+            subject_code=PRIMARY_SUBJECT_CODE,
+            subject_desc_long=PRIMARY_SUBJECT_DESC_LONG,
+        )
+        mock_section = self.get_mock_section_data(primary=False)
+        mock_stream_query.return_value = [(mock_section,)]
+        run = SyncRun.start([TERM])
+        counts, section_codes, primary_section_ids = Section.sync_partition(
+            (TERM, SCHOOL_CODE), run.pk
+        )
+        self.assertEqual(counts["updated"], 1)
+        self.assertEqual(section_codes, {mock_section[0]})
+        self.assertEqual(
+            primary_section_ids[mock_section[0]],
+            (mock_section[1], mock_section[11], TERM),
+        )
+        _, kwargs = mock_stream_query.call_args.args
+        self.assertEqual(kwargs, {"term": TERM, "school_code": SCHOOL_CODE})
+        checkpoint = run.checkpoints.get(term=TERM, school_code=SCHOOL_CODE)
+        self.assertTrue(checkpoint.completed)
+        self.assertEqual(checkpoint.last_section_code, mock_section[0])
+
+    @patch(EXECUTE_QUERY)
+    def test_bulk_update_or_create_unchanged(self, mock_execute_query):
+        mock_execute_query.return_value = (
+            (PRIMARY_SUBJECT_CODE, PRIMARY_SUBJECT_DESC_LONG, SCHOOL_CODE),
+        )
+        row = self.get_mock_section_data()
+        context = SyncContext(preload=True)
+        Section.bulk_update_or_create([row], sync_related_data=False, context=context)
+        section = Section.objects.get(section_code=row[0])
+        self.assertTrue(section.fingerprint)
+        Section.bulk_update_or_create([row], sync_related_data=False, context=context)
+        self.assertEqual(
+            Section.objects.get(section_code=row[0]).updated_at, section.updated_at
+        )
+        changed_row = row[:7] + ("New Title",) + row[8:]
+        Section.bulk_update_or_create(
+            [changed_row], sync_related_data=False, context=context
+        )
+        self.assertEqual(Section.objects.get(section_code=row[0]).title, "New Title")
+        self.assertEqual(
+            context.counts,
+            {
+                "inserted": 1,
+                "updated": 1,
+                "unchanged": 1,
+                "deleted": 0,
+                "failed": 0,
+            },
+        )
+
+    @patch(EXECUTE_QUERY)
+    def test_delete_stale_sections(self, mock_execute_query):
+        mock_execute_query.return_value = ()
+        stale_section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM + 1,
+            SECTION_NUM,
+            TERM,
+            TITLE,
+        )
+        requested_section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM + 2,
+            SECTION_NUM,
+            TERM,
+            TITLE,
+        )
+        Request.objects.create(section=requested_section, requester=create_user())
+        Section.objects.filter(pk__in=[self.section.pk, requested_section.pk]).update(
+            primary_section=stale_section
+        )
+        section_codes = {self.section.section_code}
+        with patch(SYNC_MAX_DELETE_FRACTION, 0.1):
+            deleted_count = Section.delete_stale_sections([TERM], section_codes)
+        self.assertEqual(deleted_count, 0)
+        self.assertTrue(Section.objects.filter(pk=stale_section.pk).exists())
+        with patch(SYNC_MAX_DELETE_FRACTION, 0.7):
+            deleted_count = Section.delete_stale_sections([TERM], section_codes)
+        self.assertEqual(deleted_count, 1)
+        self.assertFalse(Section.objects.filter(pk=stale_section.pk).exists())
+        self.assertTrue(Section.objects.filter(pk=requested_section.pk).exists())
+        self.assertTrue(Request.objects.filter(section=requested_section).exists())
+        self.assertIsNone(Section.objects.get(pk=self.section.pk).primary_section)
+        self.assertIsNone(Section.objects.get(pk=requested_section.pk).primary_section)
+
+    def test_sync_all_related_sections(self):
+        other_section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM,
+            SECTION_NUM + 1,
+            TERM,
+            TITLE,
+        )
+        stale_section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM + 1,
+            SECTION_NUM,
+            TERM,
+            TITLE,
+        )
+        self.section.course_sections.add(stale_section)
+        Section.sync_all_related_sections(TERM)
+        self.assertEqual(list(self.section.course_sections.all()), [other_section])
+        self.assertEqual(list(other_section.course_sections.all()), [self.section])
+        self.assertFalse(stale_section.course_sections.exists())
+        self.assertFalse(self.section.also_offered_as.exists())
+
+    @patch(STREAM_QUERY)
+    @patch(EXECUTE_QUERY)
+    def test_sync_all_section_instructors(self, mock_execute_query, mock_stream_query):
+        mock_execute_query.return_value = ()
+        section_code = self.section.section_code
+        removed_instructor = create_user("removed")
+        self.section.instructors.add(removed_instructor)
+        mock_stream_query.return_value = [
+            [
+                (section_code, PENNKEY, FIRST_NAME, LAST_NAME, PENN_ID, EMAIL, "Y"),
+                (section_code, "other", "Other", LAST_NAME, PENN_ID + 1, None, "N"),
+                (
+                    f"MISSING{TERM}",
+                    "missing",
+                    "Missing",
+                    LAST_NAME,
+                    PENN_ID + 2,
+                    None,
+                    "N",
+                ),
+            ]
+        ]
+        with patch(SYNC_MAX_DELETE_FRACTION, 0.5):
+            Section.sync_all_section_instructors(TERM)
+        section = Section.objects.get(section_code=section_code)
+        self.assertEqual(section.primary_instructor.username, PENNKEY)
+        self.assertTrue(section.instructors.filter(username="removed").exists())
+        self.assertTrue(section.instructors.filter(username="other").exists())
+        self.assertFalse(section.instructors_fingerprint)
+        with patch(SYNC_MAX_DELETE_FRACTION, 0.5):
+            Section.sync_all_section_instructors(TERM, force=True)
+        section = Section.objects.get(section_code=section_code)
+        self.assertEqual(section.primary_instructor.username, PENNKEY)
+        self.assertEqual(section.primary_instructor.penn_id, PENN_ID)
+        self.assertEqual(
+            list(section.instructors.values_list("username", flat=True)), ["other"]
+        )
+        self.assertTrue(User.objects.filter(username="missing").exists())
+        mock_stream_query.return_value = []
+        with patch(SYNC_MAX_DELETE_FRACTION, 1):
+            Section.sync_all_section_instructors(TERM)
+        self.assertTrue(section.instructors.exists())
+        section.instructors.clear()
+        mock_execute_query.return_value = [
+            (PENNKEY, FIRST_NAME, LAST_NAME, PENN_ID, EMAIL, "Y"),
+            ("other", "Other", LAST_NAME, PENN_ID + 1, None, "N"),
+            INSTRUCTORS[1],
+        ]
+        section.sync_instructors()
+        self.assertFalse(section.instructors.exists())
+
+    @patch(STREAM_QUERY)
+    @patch(EXECUTE_QUERY)
+    def test_sync(self, mock_execute_query, mock_stream_query):
+        mock_stream_query.side_effect = [
+            [(self.get_mock_section_data(primary=False),)],
+            [(self.get_mock_section_data(),)],
+        ]
         mock_execute_query.side_effect = [
-            (self.get_mock_section_data(primary=False),),
             ((PRIMARY_SUBJECT_CODE, PRIMARY_SUBJECT_DESC_LONG, SCHOOL_CODE),),
-            (self.get_mock_section_data(),),
             self.mock_instructors_response,
             self.mock_empty_response,
             self.mock_empty_response,
@@ -588,6 +1008,54 @@ class SectionTest(TestCase):
         self.assertEqual(canvas_name, self.canvas_name)
 
 
+class AutoAddTest(TestCase):
+    @patch(EXECUTE_QUERY)
+    def test_clear_inactive_employees(self, mock_execute_query):
+        mock_execute_query.return_value = ()
+        section = create_section(
+            SCHOOL_CODE,
+            SCHOOL_DESC_LONG,
+            SUBJECT_CODE,
+            SUBJECT_DESC_LONG,
+            SCHED_TYPE_CODE,
+            SCHED_TYPE_DESC,
+            COURSE_NUM,
+            SECTION_NUM,
+            TERM,
+            TITLE,
+        )
+        inactive_pennkey = "inactive"
+        null_status_pennkey = "nullstatus"
+        missing_pennkey = "missing"
+        users = (
+            create_user(),
+            create_user(inactive_pennkey),
+            create_user(null_status_pennkey),
+            create_user(missing_pennkey),
+        )
+        for user in users:
+            AutoAdd.objects.create(
+                user=user, school=section.school, subject=section.subject
+            )
+        mock_execute_query.reset_mock()
+        mock_execute_query.return_value = (
+            (PENNKEY, "A"),
+            (inactive_pennkey, "T"),
+            (null_status_pennkey, None),
+            (null_status_pennkey, "A"),
+        )
+        with AutoAdd.cache_employment_statuses():
+            AutoAdd.clear_inactive_employees()
+            auto_adds = Request.get_auto_adds(section.school, section.subject)
+        mock_execute_query.assert_called_once()
+        self.assertEqual(
+            sorted(auto_add.user.username for auto_add in auto_adds),
+            [missing_pennkey, PENNKEY],
+        )
+        self.assertFalse(AutoAdd.objects.filter(user__username=inactive_pennkey))
+        self.assertFalse(AutoAdd.objects.filter(user__username=null_status_pennkey))
+
+
 class RequestTest(TestCase):
     @classmethod
     @patch(EXECUTE_QUERY)
@@ -0,0 +1,76 @@
+from pathlib import Path
+from sqlite3 import connect
+from tempfile import TemporaryDirectory
+
+from django.test import TestCase
+
+from form import data_warehouse
+from form.data_warehouse import (
+    DataWarehouseError,
+    SqliteBackend,
+    execute_query,
+    stream_query,
+)
+from form.models import ScheduleType, Section, SectionRow
+from form.sqlite_warehouse import (
+    SCHEDULE_TYPES,
+    TABLES,
+    extract_data_warehouse,
+    generate_data_warehouse,
+)
+from form.terms import CURRENT_TERM
+
+SECTION_COUNT = 200
+
+
+class SqliteWarehouseTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "data_warehouse.sqlite3")
+        generate_data_warehouse(self.path, SECTION_COUNT, [CURRENT_TERM])
+        self.original_backend = data_warehouse.backend
+        data_warehouse.set_backend(SqliteBackend(self.path))
+
+    def tearDown(self):
+        data_warehouse.set_backend(self.original_backend)
+        self.directory.cleanup()
+
+    def test_execute_query(self):
+        schedule_types = list(execute_query(ScheduleType.QUERY))
+        self.assertEqual(len(schedule_types), len(SCHEDULE_TYPES))
+
+    def test_stream_query(self):
+        query, kwargs = Section.get_terms_query_and_bindings(CURRENT_TERM)
+        batches = list(stream_query(query, kwargs, batch_size=50))
+        rows = [row for batch in batches for row in batch]
+        self.assertTrue(rows)
+        self.assertTrue(all(len(batch) <= 50 for batch in batches))
+        self.assertTrue(all(row[6] == CURRENT_TERM for row in rows))
+
+    def test_row_factory(self):
+        query, kwargs = Section.get_terms_query_and_bindings(CURRENT_TERM)
+        batches = stream_query(query, kwargs, row_factory=SectionRow)
+        row = next(iter(next(batches)))
+        self.assertIsInstance(row, SectionRow)
+        self.assertEqual(row.section_code, f"{row.section_id}{row.term}")
+        self.assertEqual(row.term, CURRENT_TERM)
+
+    def test_missing_table(self):
+        with self.assertRaises(DataWarehouseError):
+            execute_query("SELECT missing FROM dwngss.v_missing")
+
+    def test_extract_data_warehouse(self):
+        snapshot = str(Path(self.directory.name) / "snapshot.sqlite3")
+        row_counts = extract_data_warehouse(snapshot, [CURRENT_TERM])
+        self.assertEqual(set(row_counts), set(TABLES))
+        self.assertEqual(row_counts["crse_section"], SECTION_COUNT)
+        self.assertEqual(row_counts["v_sched_type"], len(SCHEDULE_TYPES))
+        connection = connect(snapshot)
+        penn_ids = connection.execute(
+            "SELECT COUNT(DISTINCT instructor_penn_id) FROM crse_sect_instructor"
+        ).fetchone()
+        employees = connection.execute(
+            "SELECT COUNT(*) FROM employee_general"
+        ).fetchone()
+        connection.close()
+        self.assertEqual(penn_ids, employees)